@@ -3,30 +3,8 @@
     https://www.hackerrank.com/challenges/designer-door-mat/problem
     """
 
-def print_line(line_nr: int, N: int, M: int) -> None:
-    """Print the design line corresponding to line_nr for a design of length N and width M.
-    
-    :param int line_nr: The line number to generate and print.
-    :param int N: The design's length.
-    :param int M: The design's width.
-    """
-
-    # Design elements
-    FILL = ".|."
-    DASH = "-"
-    WORD = "WELCOME"
-
-    middle = N // 2
-
-    if line_nr == middle:
-        dash_amt = (M - len(WORD)) // 2
-        line = DASH * dash_amt + WORD + DASH * dash_amt
-    else:
-        distance_from_middle = abs(middle - line_nr)
-        fill_amt = 1 + 2 * (middle - distance_from_middle)
-        dash_amt = (M - fill_amt * len(FILL)) // 2
-        line = DASH * dash_amt + FILL * fill_amt + DASH * dash_amt
-    print(line)
+import sys
+from itertools import chain
 
 def validate(N: int, M: int) -> None:
     """Validates the input parameters according to the design's constraints.
@@ -53,9 +31,37 @@ def create_mat(N: int, M: int) -> None:
     :return: None
     """
 
+    sys.stdout.flush()
+    sys.stdout.buffer.write(build_mat(N, M))
+    sys.stdout.buffer.flush()
+
+def build_mat(N: int, M: int) -> bytes:
+    """Builds the whole mat as bytes, one line per row.
+
+    Only the top half is rendered, the bottom half is the top half reversed.
+    Each row reuses one dash run sliced from the widest padding, so no
+    row recomputes its fill or padding from scratch.
+
+    :param int N: The mat's length. Odd number.
+    :param int M: The mat's width. 3 times N.
+    :return bytes: The mat, with a trailing new line.
+    """
+
     validate(N, M)
-    for line_nr in range(N):
-        print_line(line_nr, N, M)
+
+    FILL = b".|."
+    DASH = b"-"
+    WORD = b"WELCOME"
+
+    middle = N // 2
+    dashes = DASH * (M // 2)
+    top: list[bytes] = []
+    for line_nr in range(middle):
+        fill_amt = 1 + 2 * line_nr
+        pad = dashes[:(M - fill_amt * len(FILL)) // 2]
+        top.append(pad + FILL * fill_amt + pad + b"\n")
+    center = dashes[:(M - len(WORD)) // 2]
+    return b"".join(chain(top, (center + WORD + center + b"\n",), reversed(top)))
 
 def main():
     """Main function to handle input and create mat."""
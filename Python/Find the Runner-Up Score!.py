@@ -3,11 +3,97 @@
     https://www.hackerrank.com/challenges/find-second-maximum-number-in-a-list/problem
     """
 
+import sys
+from collections.abc import Iterable, Iterator
+from heapq import heappush, heappushpop
+from itertools import islice
+from typing import BinaryIO
+
+from block_input import read_tokens
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def read_scores(source: BinaryIO, block_size: int = 1 << 20, /) -> Iterator[int]:
+    """Yields the whitespace separated integers of a binary stream, reading it in blocks.
+
+    Args:
+        source (BinaryIO): The stream to read.
+        block_size (int, optional): The read size in bytes. Defaults to 1 MiB.
+
+    Returns:
+        Iterator[int]: The integers, in order.
+    """
+
+    return map(int, read_tokens(source, block_size))
+
+def top_k_distinct(scores: Iterable[int], k: int, /) -> list[int]:
+    """Returns the k highest distinct scores in descending order, in one pass.
+
+    A min-heap and a set hold the current k distinct maxima, so this is
+    O(n log k) time and O(k) memory.
+
+    Args:
+        scores (Iterable[int]): The scores.
+        k (int): How many distinct scores to keep.
+
+    Returns:
+        list[int]: Up to k scores, highest first. Empty when k <= 0.
+    """
+
+    if k <= 0:
+        return []
+    heap: list[int] = []
+    kept: set[int] = set()
+    for score in scores:
+        if score in kept:
+            continue
+        if len(heap) < k:
+            heappush(heap, score)
+            kept.add(score)
+        elif score > heap[0]:
+            kept.discard(heappushpop(heap, score))
+            kept.add(score)
+    return sorted(heap, reverse=True)
+
+def top_k_distinct_array(scores, k: int, /) -> list[int]:
+    """Returns the k highest distinct scores of a NumPy array, highest first.
+
+    Only a partitioned top slice is deduplicated with np.unique; the slice
+    doubles until it holds k distinct values, so the array is never sorted.
+
+    Args:
+        scores (numpy.ndarray): The scores, for example from numpy.fromfile.
+        k (int): How many distinct scores to keep.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+
+    Returns:
+        list[int]: Up to k scores, highest first. Empty when k <= 0.
+    """
+
+    if np is None:
+        raise ImportError("top_k_distinct_array requires NumPy.")
+    if k <= 0:
+        return []
+    scores = np.asarray(scores).ravel()
+    size = min(k, scores.size)
+    while True:
+        if size >= scores.size:
+            top = np.unique(scores)
+            break
+        top = np.unique(np.partition(scores, -size)[-size:])
+        if top.size >= k:
+            break
+        size *= 2
+    return top[::-1][:k].tolist()
+
 if __name__ == '__main__':
-    n = int(input())
-    arr = sorted(map(int, input().split()), reverse=True)
-    last = arr[0]
-    for i in arr[1:]:
-        if i != last:
-            print(i)
-            break
\ No newline at end of file
+    numbers = read_scores(sys.stdin.buffer)
+    n = next(numbers)
+    top = top_k_distinct(islice(numbers, n), 2)
+    if len(top) == 2:
+        print(top[1])
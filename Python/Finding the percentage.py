@@ -3,13 +3,134 @@
     https://www.hackerrank.com/challenges/finding-the-percentage/problem
     """
 
+from array import array
+from collections.abc import Iterable
+from itertools import islice
+from typing import TextIO
+
+class MarksStore:
+    """Student marks kept in compact arrays, indexed by name.
+
+    All marks are stored back to back in one array('d'), and the sum and
+    count of each student's marks are computed once when they are added,
+    so every average query is O(1). Replaced marks are overwritten in place
+    when the count is unchanged. Otherwise the old ones become garbage, and
+    the array is compacted once there is more garbage than live marks.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self._marks: array = array('d')
+        self._offsets: array = array('q')
+        self._sums: array = array('d')
+        self._counts: array = array('q')
+        self._garbage: int = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def add(self, name: str, marks: Iterable[float]) -> None:
+        """Adds a student's marks, replacing any previous ones.
+
+        Args:
+            name (str): The student's name.
+            marks (Iterable[float]): The student's marks.
+        """
+
+        values = array('d', marks)
+        count = len(values)
+        total = sum(values)
+        row = self._index.get(name)
+        if row is None:
+            self._index[name] = len(self._sums)
+            self._offsets.append(len(self._marks))
+            self._sums.append(total)
+            self._counts.append(count)
+            self._marks.extend(values)
+            return
+        offset = self._offsets[row]
+        if count == self._counts[row]:
+            self._marks[offset:offset + count] = values
+        else:
+            self._garbage += self._counts[row]
+            self._offsets[row] = len(self._marks)
+            self._marks.extend(values)
+            self._counts[row] = count
+            if 2 * self._garbage > len(self._marks):
+                self._compact()
+        self._sums[row] = total
+
+    def _compact(self) -> None:
+        """Drops the replaced marks, keeping every student's marks in row order."""
+
+        marks = array('d')
+        for row, (offset, count) in enumerate(zip(self._offsets, self._counts)):
+            self._offsets[row] = len(marks)
+            marks.extend(self._marks[offset:offset + count])
+        self._marks = marks
+        self._garbage = 0
+
+    def marks(self, name: str) -> array:
+        """Returns a copy of a student's marks.
+
+        Raises:
+            KeyError: If the student is unknown.
+        """
+
+        row = self._index[name]
+        offset = self._offsets[row]
+        return self._marks[offset:offset + self._counts[row]]
+
+    def average(self, name: str) -> float:
+        """Returns the average of a student's marks.
+
+        Raises:
+            KeyError: If the student is unknown.
+            ZeroDivisionError: If the student has no marks.
+        """
+
+        row = self._index[name]
+        return self._sums[row] / self._counts[row]
+
+    def averages(self, names: Iterable[str]) -> list[float]:
+        """Returns the average of each given student's marks, in order.
+
+        Raises:
+            KeyError: If a student is unknown.
+        """
+
+        index, sums, counts = self._index, self._sums, self._counts
+        return [sums[row] / counts[row] for row in map(index.__getitem__, names)]
+
+    @classmethod
+    def load(cls, stream: TextIO, count: int | None = None) -> 'MarksStore':
+        """Builds a store from "name mark mark ..." lines, one line at a time.
+
+        Args:
+            stream (TextIO): The roster.
+            count (int, optional): How many lines to read. Defaults to all of them.
+
+        Returns:
+            MarksStore: The loaded store.
+        """
+
+        store = cls()
+        lines = stream if count is None else islice(stream, count)
+        for line in lines:
+            fields = line.split()
+            if fields:
+                store.add(fields[0], map(float, fields[1:]))
+        return store
+
 if __name__ == '__main__':
     n = int(input())
-    student_marks = {}
+    student_marks = MarksStore()
     for _ in range(n):
         name, *line = input().split()
-        scores = list(map(float, line))
-        student_marks[name] = scores
+        student_marks.add(name, map(float, line))
     query_name = input()
-    average = sum(student_marks[query_name]) / len(student_marks[query_name])
+    average = student_marks.average(query_name)
     print(f"{average:.2f}")
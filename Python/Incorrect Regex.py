@@ -3,13 +3,187 @@
     https://www.hackerrank.com/challenges/incorrect-regex/problem
     """
 
+import os
 import re
+import signal
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+class PatternTimeout(Exception):
+    """Raised when a pattern takes too long to compile."""
+
+def _raise_timeout(signum, frame):
+    raise PatternTimeout()
+
+def check_patterns(patterns: list[str], timeout: float | None = None) -> list[bool | None]:
+    """Checks whether each pattern compiles.
+
+    The timeout is enforced with a real-time interval timer, so it is only
+    applied where signal.setitimer exists and when called from the main
+    thread, which is always the case inside a worker process. A timer the
+    caller had armed is paused meanwhile and re-armed with its remaining time
+    when the check ends, or fired right away if it expired in between.
+
+    :param list[str] patterns: The patterns to check.
+    :param float timeout: Seconds allowed per pattern. Defaults to no limit.
+    :return list[bool | None]: True if valid, False if not, None on timeout.
+    """
+
+    guarded = (timeout is not None and hasattr(signal, 'setitimer')
+               and threading.current_thread() is threading.main_thread())
+    if guarded:
+        previous_timer = signal.setitimer(signal.ITIMER_REAL, 0)
+        started = time.monotonic()
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    results: list[bool | None] = []
+    try:
+        for pattern in patterns:
+            try:
+                if guarded:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                try:
+                    re.compile(pattern)
+                finally:
+                    if guarded:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+                results.append(True)
+            except (re.error, OverflowError, RecursionError):
+                results.append(False)
+            except PatternTimeout:
+                results.append(None)
+    finally:
+        if guarded:
+            signal.signal(signal.SIGALRM, previous)
+            delay, interval = previous_timer
+            if delay:
+                remaining = delay - (time.monotonic() - started)
+                signal.setitimer(signal.ITIMER_REAL, max(remaining, 1e-6), interval)
+    return results
+
+class RegexValidator:
+    """Validates batches of patterns with caching and a process pool.
+
+    Results are kept in a bounded LRU cache keyed by pattern. Each batch is
+    deduplicated, and the patterns missing from the cache are compiled in
+    chunks across worker processes, each pattern under its own timeout.
+    Patterns that time out are reported as invalid and counted in stats(),
+    but not cached, so they are compiled again by the next batch.
+    """
+
+    # Below this many uncached patterns a batch is compiled in process.
+    PARALLEL_LIMIT: int = 4096
+
+    def __init__(
+        self,
+        cache_size: int = 1 << 16,
+        workers: int | None = None,
+        timeout: float | None = 1.0,
+        chunk_size: int = 256) -> None:
+        """
+        :param int cache_size: The maximum amount of cached patterns.
+        :param int workers: Worker processes. Defaults to os.cpu_count().
+        :param float timeout: Seconds allowed per pattern, None for no limit.
+        :param int chunk_size: Patterns sent to a worker at a time.
+        """
+
+        self.cache_size = cache_size
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self._cache: OrderedDict[str, bool] = OrderedDict()
+        self._executor: ProcessPoolExecutor | None = None
+        self.patterns = self.hits = self.misses = self.timeouts = 0
+        self.seconds = 0.0
+
+    def __enter__(self) -> 'RegexValidator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts the worker processes down."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _compile(self, patterns: list[str]) -> list[bool | None]:
+        if self.workers <= 1 or len(patterns) < self.PARALLEL_LIMIT:
+            return check_patterns(patterns, self.timeout)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+        chunks = [patterns[i:i + self.chunk_size] for i in range(0, len(patterns), self.chunk_size)]
+        results: list[bool | None] = []
+        for chunk_results in self._executor.map(check_patterns, chunks, [self.timeout] * len(chunks)):
+            results.extend(chunk_results)
+        return results
+
+    def validate(self, patterns: Iterable[str]) -> list[bool]:
+        """Checks whether each pattern is a valid regular expression.
+
+        :param Iterable[str] patterns: The patterns to check.
+        :return list[bool]: The result of each pattern, in order.
+        """
+
+        start = time.perf_counter()
+        patterns = list(patterns)
+        cache = self._cache
+
+        # Only the first occurrence of an uncached pattern is compiled.
+        missing = list(dict.fromkeys(pattern for pattern in patterns if pattern not in cache))
+        known: dict[str, bool] = {}
+        timed_out: set[str] = set()
+        for pattern, result in zip(missing, self._compile(missing)):
+            if result is None:
+                self.timeouts += 1
+                timed_out.add(pattern)
+            known[pattern] = bool(result)
+
+        results: list[bool] = []
+        for pattern in patterns:
+            if pattern in known:
+                result = known[pattern]
+            else:
+                result = cache[pattern]
+                cache.move_to_end(pattern)
+            results.append(result)
+        for pattern, result in known.items():
+            if pattern in timed_out:
+                continue
+            cache[pattern] = result
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        self.patterns += len(patterns)
+        self.misses += len(missing)
+        self.hits += len(patterns) - len(missing)
+        self.seconds += time.perf_counter() - start
+        return results
+
+    def stats(self) -> dict[str, float]:
+        """Returns the totals since the validator was created.
+
+        :return dict[str, float]: The amount of patterns, cache hits, cache
+            misses and timeouts, the hit rate, the seconds spent and the
+            throughput in patterns per second.
+        """
+
+        return {
+            'patterns': self.patterns,
+            'hits': self.hits,
+            'misses': self.misses,
+            'timeouts': self.timeouts,
+            'hit_rate': self.hits / self.patterns if self.patterns else 0.0,
+            'seconds': self.seconds,
+            'throughput': self.patterns / self.seconds if self.seconds else 0.0,
+        }
 
 if __name__ == '__main__':
-    test_patterns = [raw_input() for _ in range(int(input()))]
-    for pattern in test_patterns:
-        try:
-            re.compile(pattern)
-            print(True)
-        except re.error:
-            print(False)
+    test_patterns = [input() for _ in range(int(input()))]
+    with RegexValidator() as validator:
+        for result in validator.validate(test_patterns):
+            print(result)
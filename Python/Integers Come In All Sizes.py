@@ -3,10 +3,202 @@
     https://www.hackerrank.com/challenges/python-integers-come-in-all-sizes/problem
     """
 
+import sys
+from collections.abc import Iterator
+from decimal import (MAX_EMAX, MAX_PREC, MIN_EMIN, ROUND_DOWN, Context, Decimal, Inexact,
+                     Rounded)
+from typing import TextIO
+
+# Exact integer arithmetic: any rounding raises instead of losing digits.
+EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[Inexact, Rounded])
+
+def validate(a: int, b: int, c: int, d: int, /) -> None:
+    """Validates the inputs.
+
+    Args:
+        a (int): The first base.
+        b (int): The first exponent.
+        c (int): The second base.
+        d (int): The second exponent.
+
+    Raises:
+        TypeError: If an input is not an integer.
+        ValueError: If an exponent is negative.
+    """
+
+    for value in (a, b, c, d):
+        if not isinstance(value, int):
+            raise TypeError(f"Expected integers, got {type(value).__name__}.")
+    if b < 0 or d < 0:
+        raise ValueError("Exponents must be non-negative.")
+
+def int_to_decimal(number: int, /) -> Decimal:
+    """Converts an int to an exact Decimal by divide and conquer.
+
+    The number is split in halves by bits and recombined with powers of two,
+    so the quadratic int to decimal conversion is replaced by the decimal
+    module's fast multiplication.
+
+    Args:
+        number (int): The number to convert.
+
+    Returns:
+        Decimal: The same number.
+    """
+
+    powers: dict[int, Decimal] = {}
+
+    def power_of_two(bits: int) -> Decimal:
+        if bits not in powers:
+            if bits <= 128:
+                powers[bits] = EXACT.power(Decimal(2), bits)
+            else:
+                half = bits >> 1
+                powers[bits] = EXACT.multiply(power_of_two(half), power_of_two(bits - half))
+        return powers[bits]
+
+    def convert(number: int, bits: int) -> Decimal:
+        if bits <= 128:
+            return Decimal(number)
+        half = bits >> 1
+        high = number >> half
+        low = number - (high << half)
+        return EXACT.add(EXACT.multiply(convert(high, bits - half), power_of_two(half)),
+                         convert(low, half))
+
+    if number < 0:
+        return EXACT.minus(convert(-number, (-number).bit_length()))
+    return convert(number, number.bit_length())
+
+def power(base: int, exponent: int, /) -> Decimal:
+    """Computes base**exponent exactly, with 0**0 == 1 as for int.
+
+    The decimal module rejects 0**0 as an invalid operation.
+    """
+
+    if exponent == 0:
+        return Decimal(1)
+    return EXACT.power(Decimal(base), exponent)
+
+def evaluate(a: int, b: int, c: int, d: int, /) -> Decimal:
+    """Computes a**b + c**d exactly, as a Decimal.
+
+    The powers are computed by the decimal module, whose big number
+    multiplication is much faster than int's and whose values convert to
+    text in linear time.
+
+    Args:
+        a (int): The first base.
+        b (int): The first exponent.
+        c (int): The second base.
+        d (int): The second exponent.
+
+    Returns:
+        Decimal: The exact result, with exponent 0.
+    """
+
+    validate(a, b, c, d)
+    return EXACT.add(power(a, b), power(c, d))
+
+def decimal_digits(value: Decimal, chunk_digits: int = 1 << 16, /) -> Iterator[str]:
+    """Yields the decimal digits of an integral Decimal, in order, in chunks.
+
+    The value is split recursively at powers of ten (a shift of the decimal
+    exponent), so no single string longer than chunk_digits is ever built.
+
+    Args:
+        value (Decimal): An integral value with exponent 0.
+        chunk_digits (int, optional): The maximum digits per chunk. Defaults to 65536.
+
+    Returns:
+        Iterator[str]: The digit chunks, the first one with the sign.
+    """
+
+    def split(value: Decimal, width: int) -> Iterator[str]:
+        digits = value.adjusted() + 1 if value else 1
+        if max(digits, width) <= chunk_digits:
+            yield f"{value:0{width}f}" if width else f"{value:f}"
+            return
+        shift = max(digits, width) // 2
+        high = value.scaleb(-shift, EXACT).to_integral_value(ROUND_DOWN, EXACT)
+        low = EXACT.subtract(value, high.scaleb(shift, EXACT))
+        yield from split(high, max(width - shift, 0))
+        yield from split(low, shift)
+
+    if value < 0:
+        yield '-'
+        value = EXACT.minus(value)
+    yield from split(value, 0)
+
+def digit_count(a: int, b: int, c: int, d: int, /) -> int:
+    """Returns how many digits a**b + c**d has, without building its digits."""
+
+    value = evaluate(a, b, c, d)
+    return value.adjusted() + 1 if value else 1
+
+def leading_digits(a: int, b: int, c: int, d: int, count: int, /) -> str:
+    """Returns the first count digits of a**b + c**d, or all of them if it has less.
+
+    The sign is not a digit: these are the digits of abs(a**b + c**d).
+    """
+
+    if count <= 0:
+        return ''
+    value = EXACT.abs(evaluate(a, b, c, d))
+    digits = value.adjusted() + 1 if value else 1
+    if digits <= count:
+        return f"{value:f}"
+    return f"{value.scaleb(count - digits, EXACT).to_integral_value(ROUND_DOWN, EXACT):f}"
+
+def trailing_digits(a: int, b: int, c: int, d: int, count: int, /) -> str:
+    """Returns the last count digits of a**b + c**d, or all of them if it has less.
+
+    When the result surely has at least count digits, only the powers modulo
+    10**count are computed, so the cost does not depend on the full result.
+    As in leading_digits, these are the digits of abs(a**b + c**d).
+    """
+
+    validate(a, b, c, d)
+    if count <= 0:
+        return ''
+    # Lower bound of the result's bits for non-negative bases; 2**(4 * count) > 10**count.
+    lower_bits = max(b * (a.bit_length() - 1), d * (c.bit_length() - 1))
+    if a >= 0 and c >= 0 and lower_bits >= 4 * count:
+        modulus = 10 ** count
+        return f"{(pow(a, b, modulus) + pow(c, d, modulus)) % modulus:0{count}d}"
+    value = f"{EXACT.abs(evaluate(a, b, c, d)):f}"
+    return value[-count:]
+
+def write_digits(value: Decimal | int, stream: TextIO | None = None, /) -> None:
+    """Streams the decimal digits of an integer, followed by a new line.
+
+    Unlike str(int), this is not quadratic and not limited by
+    sys.get_int_max_str_digits().
+
+    Args:
+        value (Decimal | int): The value to write. Decimals must be integral.
+        stream (TextIO, optional): Where to write. Defaults to sys.stdout.
+    """
+
+    if isinstance(value, int):
+        value = int_to_decimal(value)
+    if stream is None:
+        stream = sys.stdout
+    for chunk in decimal_digits(value):
+        stream.write(chunk)
+    stream.write("\n")
+
 if __name__ == '__main__':
     a = int(input())
     b = int(input())
     c = int(input())
     d = int(input())
 
-    print(a**b + c**d)
+    if '--count' in sys.argv[1:]:
+        print(digit_count(a, b, c, d))
+    elif options := [argument for argument in sys.argv[1:] if argument.startswith(('--head=', '--tail='))]:
+        option, _, count = options[-1].partition('=')
+        digits = leading_digits if option == '--head' else trailing_digits
+        print(digits(a, b, c, d, int(count)))
+    else:
+        write_digits(evaluate(a, b, c, d))
@@ -3,27 +3,31 @@
     https://www.hackerrank.com/challenges/python-string-formatting/problem
     """
 
-from itertools import combinations
+from fractions import Fraction
+from math import comb
 
-def validate(user_input: list[str]) -> None:
+MAX_N: int = 10
+
+def validate(user_input: list[str], max_n: int = MAX_N) -> None:
     """Validates the user input according to the constraints.
 
     Params:
         user_input: The list of user inputs to validate.
+        max_n: The largest N accepted. Defaults to the problem's bound of 10.
 
     Raises:
         TypeError: If N or K are not integers.
-        ValueError: If the string is not composed of single lower-case letters separated by single spaces. Also raised if N is not 1 <= N <= 10 or if K is not 1 <= K <= N. 
+        ValueError: If the string is not composed of single lower-case letters separated by single spaces. Also raised if N is not 1 <= N <= max_n or if K is not 1 <= K <= N. 
     """
 
-    # Check K and N constraints. Must be integers such that 1 <= N <= 10 and 1 <= K <= N.
+    # Check K and N constraints. Must be integers such that 1 <= N <= max_n and 1 <= K <= N.
     try:
         N: int = int(user_input[0])
         K: int = int(user_input[2])
     except Exception as e:
         raise TypeError(f"N and K must be integers: {e}") from e
-    if not 1 <= N <= 10:
-        raise ValueError("N must be 1 <= N <= 10.")
+    if not 1 <= N <= max_n:
+        raise ValueError(f"N must be 1 <= N <= {max_n}.")
     if not 1 <= K <= N:
         raise ValueError("K must be 1 <= K <= N.")
 
@@ -64,23 +68,53 @@ def extract_a_indices(input_string: str) -> set[int]:
     input_list = input_string.split()
     return {index + 1 for index, char in enumerate(input_list) if char == 'a'}
 
-def main() -> None:
-    """Calculates the probability of an index containing the letter 'a'."""
+def calculate_probability(N: int, a_count: int, K: int, exact: bool = False) -> float | Fraction:
+    """Calculates the probability of K indices out of N containing an 'a' index.
+
+    A selection misses every 'a' with probability comb(N - a, K) / comb(N, K),
+    which equals comb(N - K, a) / comb(N, a). The float path evaluates that
+    ratio as a product of min(K, a) terms, so no combination is enumerated and
+    no big integer is built.
+
+    Params:
+        N: Total position number.
+        a_count: The amount of 'a' indices.
+        K: Number of indices to select.
+        exact: Whether to return an exact fraction instead of a float.
+
+    Returns:
+        float | Fraction: The calculated probability.
+    """
+
+    not_a = N - a_count
+    if K > not_a:
+        return Fraction(1) if exact else 1.0
+    if exact:
+        return 1 - Fraction(comb(not_a, K), comb(N, K))
+
+    # Use whichever of the two equivalent products is shorter.
+    terms, removed = (K, a_count) if K <= a_count else (a_count, K)
+    p_miss = 1.0
+    for i in range(terms):
+        p_miss *= (N - removed - i) / (N - i)
+    return 1.0 - p_miss
+
+def main(max_n: int = MAX_N, exact: bool = False) -> None:
+    """Calculates the probability of an index containing the letter 'a'.
+
+    Params:
+        max_n: The largest N accepted.
+        exact: Whether to print an exact fraction instead of a float.
+    """
 
     user_input = [input() for _ in range(3)]
-    validate(user_input)
+    validate(user_input, max_n)
 
     N: int = int(user_input[0])
     a_indices: set[int] = extract_a_indices(user_input[1].strip())
     K: int = int(user_input[2])
 
-    p_numerator: int = 0
-    index_combos: set[list] = set(combinations(range(1, N + 1), K))
-    for combo in index_combos:
-        if not a_indices.isdisjoint(combo):
-            p_numerator += 1
-
-    print(p_numerator / len(index_combos))
+    print(calculate_probability(N, len(a_indices), K, exact))
 
 if __name__ == "__main__":
     main()
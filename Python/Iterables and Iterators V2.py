@@ -3,7 +3,9 @@
     https://www.hackerrank.com/challenges/iterables-and-iterators/problem
     """
 
-from math import comb
+from array import array
+from collections.abc import Iterable
+from math import comb, expm1, lgamma, log, log1p
 
 def validate(user_input: list[str], /) -> None:
     """Validates the user input according to the constraints.
@@ -80,7 +82,137 @@ def calculate_probability(N: int, a_indices: set[int], K: int, /) -> float:
     if K > not_a:
         return 1.0
     return 1.0 - (comb(not_a, K)/comb(N, K))
- 
+
+class ProbabilityService:
+    """Answers many probability queries in log space.
+
+    Huge N never builds big integers nor overflows: the shorter of the two
+    products is summed with log1p, which keeps every digit of tiny
+    probabilities. Products too long to sum use a Stirling expansion of the
+    log ratio written with log1p, so the huge log-factorials never cancel.
+    Only when N is close to a_count + K, where the ratio is far from 1 and
+    cancellation does not matter, a lazily grown log-factorial table and
+    lgamma past the table's limit are used.
+
+    Examples:
+        >>> from fractions import Fraction
+        >>> service = ProbabilityService()
+        >>> for N, a_count, K in [(10 ** 12, 100, 100), (10 ** 15, 65, 65), (10 ** 7, 100, 100)]:
+        ...     exact = 1 - Fraction(comb(N - a_count, K), comb(N, K))
+        ...     print(abs(service.probability(N, a_count, K) / float(exact) - 1) < 1e-12)
+        True
+        True
+        True
+
+        Past PRODUCT_TERMS, the result still agrees with the log1p product:
+
+        >>> from math import fsum
+        >>> N, a_count, K = 10 ** 15, 1_500_000, 1_100_000
+        >>> product = -expm1(fsum(log1p(-a_count / (N - i)) for i in range(K)))
+        >>> abs(service.probability(N, a_count, K) / product - 1) < 1e-9
+        True
+        >>> service.probability(10, 0, 3)
+        0.0
+    """
+
+    #: Up to this many terms the log1p product is summed, past it log-factorials are used.
+    PRODUCT_TERMS: int = 1 << 20
+
+    def __init__(self, table_limit: int = 1 << 22, /) -> None:
+        """Params:
+            table_limit: Largest n kept in the log-factorial table.
+        """
+
+        self.table_limit: int = table_limit
+        self._log_factorials: array = array('d', [0.0])
+
+    def log_factorial(self, n: int, /) -> float:
+        """Natural logarithm of n!."""
+
+        if n > self.table_limit:
+            return lgamma(n + 1)
+        table = self._log_factorials
+        if n >= len(table):
+            total = table[-1]
+            for i in range(len(table), n + 1):
+                total += log(i)
+                table.append(total)
+        return table[n]
+
+    def log_comb(self, n: int, k: int, /) -> float:
+        """Natural logarithm of comb(n, k), for 0 <= k <= n."""
+
+        return self.log_factorial(n) - self.log_factorial(k) - self.log_factorial(n - k)
+
+    @staticmethod
+    def log_ratio(N: int, removed: int, terms: int, /) -> float:
+        """Natural logarithm of prod(1 - removed / (N - i) for i in range(terms)).
+
+        The product is lgamma(A + terms) - lgamma(A) - lgamma(B + terms) + lgamma(B)
+        with A = N - removed - terms + 1 and B = A + removed. Its Stirling
+        expansion is regrouped into log1p terms of about the size of the
+        result, so nothing cancels. Accurate for A >= PRODUCT_TERMS.
+        """
+
+        A = N - removed - terms + 1
+        B = A + removed
+        end = A + terms
+        main = (terms * log1p(removed / end)
+                + (A - 0.5) * log1p(-removed * terms / (end * B))
+                + removed * log1p(terms / B))
+
+        def correction(z: int) -> float:
+            return 1 / (12 * z) - 1 / (360 * z ** 3)
+
+        return correction(end) - correction(end + removed) - correction(A) + correction(B) - main
+
+    def probability(self, N: int, a_count: int, K: int, /) -> float:
+        """Calculates the probability of K indices out of N containing an 'a' index.
+
+        Params:
+            N: Total position number.
+            a_count: The amount of 'a' indices.
+            K: Number of indices to select.
+
+        Returns:
+            float: The calculated probability.
+        """
+
+        not_a = N - a_count
+        if K > not_a:
+            return 1.0
+        # comb(N - a, K) / comb(N, K) == comb(N - K, a) / comb(N, a), use the shorter product.
+        terms, removed = (K, a_count) if K <= a_count else (a_count, K)
+        if terms <= self.PRODUCT_TERMS:
+            log_p_miss = sum(log1p(-removed / (N - i)) for i in range(terms))
+        elif N - removed - terms + 1 >= self.PRODUCT_TERMS:
+            log_p_miss = self.log_ratio(N, removed, terms)
+        else:
+            log_p_miss = self.log_comb(not_a, K) - self.log_comb(N, K)
+        # max returns its first argument on ties, so -0.0 becomes 0.0.
+        return max(0.0, min(-expm1(log_p_miss), 1.0))
+
+    def probabilities(self, queries: Iterable[tuple[int, int, int]], /) -> list[float]:
+        """Answers many (N, a_count, K) queries at once.
+
+        Repeated queries are only evaluated once.
+
+        Params:
+            queries: The (N, a_count, K) triples.
+
+        Returns:
+            list[float]: The probabilities, in query order.
+        """
+
+        answers: dict[tuple[int, int, int], float] = {}
+        results: list[float] = []
+        for query in queries:
+            answer = answers.get(query)
+            if answer is None:
+                answer = answers[query] = self.probability(*query)
+            results.append(answer)
+        return results
+
 def main() -> None:
     """Calculates the probability of an index containing the letter 'a'."""
 
@@ -3,10 +3,117 @@
     https://www.hackerrank.com/challenges/list-comprehensions/problem
     """
 
+import sys
+from collections.abc import Iterator
+from itertools import islice
+from math import comb
+from typing import TextIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def coordinates(x: int, y: int, z: int, n: int, /) -> Iterator[list[int]]:
+    """Lazily yields every [i, j, k] with i <= x, j <= y, k <= z and i + j + k != n.
+
+    The order is the same as the list comprehension's.
+
+    Args:
+        x (int): The largest i.
+        y (int): The largest j.
+        z (int): The largest k.
+        n (int): The excluded sum.
+
+    Returns:
+        Iterator[list[int]]: The coordinates.
+    """
+
+    for i in range(x + 1):
+        for j in range(y + 1):
+            skip = n - i - j
+            for k in range(z + 1):
+                if k != skip:
+                    yield [i, j, k]
+
+def coordinates_array(x: int, y: int, z: int, n: int, /):
+    """Returns the same coordinates as an (M, 3) NumPy integer array.
+
+    Args:
+        x (int): The largest i.
+        y (int): The largest j.
+        z (int): The largest k.
+        n (int): The excluded sum.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+
+    Returns:
+        numpy.ndarray: One row per coordinate, in the list comprehension's order.
+    """
+
+    if np is None:
+        raise ImportError("coordinates_array requires NumPy.")
+    grid = np.indices((x + 1, y + 1, z + 1)).reshape(3, -1).T
+    return grid[grid.sum(axis=1) != n]
+
+def count_coordinates(x: int, y: int, z: int, n: int, /) -> int:
+    """Counts the coordinates in closed form.
+
+    The excluded points i + j + k == n are counted by inclusion-exclusion over
+    the three upper bounds, each term being a stars and bars count.
+
+    Args:
+        x (int): The largest i.
+        y (int): The largest j.
+        z (int): The largest k.
+        n (int): The excluded sum.
+
+    Returns:
+        int: The amount of coordinates.
+    """
+
+    if min(x, y, z) < 0:
+        return 0
+    excluded = 0
+    for mask in range(8):
+        rest = n
+        for bit, bound in enumerate((x, y, z)):
+            if mask >> bit & 1:
+                rest -= bound + 1
+        if rest >= 0:
+            excluded += (-1) ** bin(mask).count('1') * comb(rest + 2, 2)
+    return (x + 1) * (y + 1) * (z + 1) - excluded
+
+def write_coordinates(x: int, y: int, z: int, n: int, stream: TextIO | None = None,
+                      chunk_size: int = 1 << 14, /) -> None:
+    """Writes the same text as printing the list comprehension, without building it.
+
+    Args:
+        x (int): The largest i.
+        y (int): The largest j.
+        z (int): The largest k.
+        n (int): The excluded sum.
+        stream (TextIO, optional): Where to write. Defaults to sys.stdout.
+        chunk_size (int, optional): Coordinates formatted per write. Defaults to 16384.
+    """
+
+    if stream is None:
+        stream = sys.stdout
+    points = coordinates(x, y, z, n)
+    separator = '['
+    while chunk := list(islice(points, chunk_size)):
+        stream.write(separator + ', '.join(map(repr, chunk)))
+        separator = ', '
+    stream.write('[]\n' if separator == '[' else ']\n')
+
 if __name__ == '__main__':
     x = int(input())
     y = int(input())
     z = int(input())
     n = int(input())
 
-    print([[i,j,k] for i in range(x+1) for j in range(y+1) for k in range(z+1) if i+j+k != n])
+    if '--count' in sys.argv[1:]:
+        print(count_coordinates(x, y, z, n))
+    else:
+        write_coordinates(x, y, z, n)
@@ -3,6 +3,16 @@
     https://www.hackerrank.com/challenges/python-lists/problem
     """
 
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from hashlib import blake2b
+from itertools import islice
+from math import isqrt
+from typing import BinaryIO
+
+from block_input import read_tokens
+
 def validate(N: int) -> None:
     """Validates the user input.
 
@@ -14,26 +24,374 @@ def validate(N: int) -> None:
     if N < 1:
         raise ValueError("Expected a positive non-zero integer.")
 
-if __name__ == '__main__':
+class BlockList:
+    """A list of integers stored in blocks of about sqrt(n) values (sqrt decomposition).
+
+    Positional insert and remove only shift the elements of one block, so they
+    are O(sqrt n) instead of O(n). The block sizes are kept in a Fenwick tree,
+    so finding the block of a position is O(log n), and the first and last
+    blocks are found in O(1), which keeps append and pop at the ends cheap.
+    Blocks that grow too large are split and blocks that become underfull are
+    merged with a neighbour; when the length changes by a factor of about
+    four, the blocks are rebuilt for the new sqrt(n).
+
+    reverse only flips a flag and the elements are read backwards while it
+    is set. After sort the list remembers that it is sorted until an element
+    is inserted out of order, so sorting again is free and remove can binary
+    search for its value.
+
+    Its repr is the repr of the equivalent list.
+    """
+
+    MIN_BLOCK_SIZE: int = 64
+
+    def __init__(self, values: Iterable[int] = (), /) -> None:
+        self._blocks: list[list[int]] = []
+        self._tree: list[int] = [0]
+        self._step: int = 0
+        self._len: int = 0
+        self._block_size: int = self.MIN_BLOCK_SIZE
+        self._reversed: bool = False
+        self._sorted: bool = False
+        self._load(list(values))
+
+    def _load(self, values: list[int], /) -> None:
+        """Replaces the contents with the given values, in physical order."""
+
+        size = self._block_size = max(self.MIN_BLOCK_SIZE, isqrt(len(values)))
+        self._blocks = [values[i:i + size] for i in range(0, len(values), size)]
+        self._len = len(values)
+        self._index()
+
+    def _index(self) -> None:
+        """Rebuilds the Fenwick tree of block sizes, in O(blocks)."""
+
+        tree = [0]
+        tree.extend(map(len, self._blocks))
+        count = len(self._blocks)
+        for i in range(1, count + 1):
+            parent = i + (i & -i)
+            if parent <= count:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._step = 1 << count.bit_length() >> 1
+
+    def _resize(self, block_nr: int, delta: int, /) -> None:
+        """Adds delta to the size of a block in the Fenwick tree."""
+
+        tree = self._tree
+        i = block_nr + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        if self._reversed:
+            for block in reversed(self._blocks):
+                yield from reversed(block)
+        else:
+            for block in self._blocks:
+                yield from block
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def _physical(self, index: int, /) -> int:
+        """Maps a logical position in the range 0 <= index <= len to a physical one."""
+
+        return self._len - index if self._reversed else index
+
+    def _locate(self, position: int, /) -> tuple[int, int]:
+        """Finds the block and offset of a physical position, 0 <= position <= len."""
+
+        blocks = self._blocks
+        if position < len(blocks[0]):
+            return 0, position
+        last = len(blocks) - 1
+        start = self._len - len(blocks[last])
+        if position >= start:
+            return last, position - start
+        # Descend the Fenwick tree to the last block starting at or before position.
+        tree = self._tree
+        block_nr = 0
+        step = self._step
+        while step:
+            child = block_nr + step
+            if child <= last and tree[child] <= position:
+                block_nr = child
+                position -= tree[child]
+            step >>= 1
+        return block_nr, position
+
+    def _insert_physical(self, position: int, value: int, /) -> None:
+        if not self._blocks:
+            self._blocks.append([value])
+            self._len = 1
+            self._index()
+            return
+        block_nr, offset = self._locate(position)
+        block = self._blocks[block_nr]
+        if self._sorted:
+            # Neighbours inside the block are enough, except at its edges.
+            before = block[offset - 1] if offset else self._edge(block_nr - 1, -1)
+            after = block[offset] if offset < len(block) else self._edge(block_nr + 1, 0)
+            if (before is not None and before > value) or (after is not None and value > after):
+                self._sorted = False
+        block.insert(offset, value)
+        self._len += 1
+        size = self._block_size
+        if len(block) <= 2 * size:
+            self._resize(block_nr, 1)
+        elif len(self._blocks) < 2 * size:
+            self._blocks[block_nr:block_nr + 1] = [block[:size], block[size:]]
+            self._index()
+        else:
+            # Too many blocks for the block size, rebuild them for the new sqrt(n).
+            self._load([value for block in self._blocks for value in block])
+
+    def _edge(self, block_nr: int, offset: int, /) -> int | None:
+        if 0 <= block_nr < len(self._blocks):
+            return self._blocks[block_nr][offset]
+        return None
+
+    def _delete(self, block_nr: int, offset: int, /) -> int:
+        blocks = self._blocks
+        block = blocks[block_nr]
+        value = block.pop(offset)
+        self._len -= 1
+        size = self._block_size
+        if size > self.MIN_BLOCK_SIZE and 4 * self._len < size * size:
+            # The blocks are too large for the length, rebuild them for the new sqrt(n).
+            self._load([value for block in blocks for value in block])
+        elif 4 * len(block) >= size:
+            self._resize(block_nr, -1)
+        elif len(blocks) > 1:
+            # Merge the underfull block into a neighbour, splitting it again if too large.
+            if block_nr == len(blocks) - 1:
+                block_nr -= 1
+            merged = blocks[block_nr] + blocks[block_nr + 1]
+            if len(merged) > 2 * size:
+                half = len(merged) // 2
+                blocks[block_nr:block_nr + 2] = [merged[:half], merged[half:]]
+            else:
+                blocks[block_nr:block_nr + 2] = [merged]
+            self._index()
+        elif block:
+            self._resize(block_nr, -1)
+        else:
+            blocks.clear()
+            self._index()
+        return value
+
+    def insert(self, index: int, value: int, /) -> None:
+        """Inserts value before index, with the same index rules as list.insert.
+
+        :param int index: The logical position.
+        :param int value: The value to insert.
+        """
+
+        if index < 0:
+            index = max(index + self._len, 0)
+        index = min(index, self._len)
+        self._insert_physical(self._physical(index), value)
+
+    def append(self, value: int, /) -> None:
+        """Appends value at the end, in O(1) unless its block is split.
+
+        :param int value: The value to append.
+        """
+
+        self._insert_physical(0 if self._reversed else self._len, value)
+
+    def remove(self, value: int, /) -> None:
+        """Removes the first occurrence of value.
+
+        :param int value: The value to remove.
+
+        Raises:
+            ValueError: If the value is not present.
+        """
+
+        blocks = self._blocks
+        if self._sorted and blocks:
+            # The first logical occurrence is the last physical one when reversed.
+            if self._reversed:
+                block_nr = bisect_right(blocks, value, key=lambda block: block[0]) - 1
+                if block_nr >= 0:
+                    offset = bisect_right(blocks[block_nr], value) - 1
+                    if blocks[block_nr][offset] == value:
+                        self._delete(block_nr, offset)
+                        return
+            else:
+                block_nr = bisect_left(blocks, value, key=lambda block: block[-1])
+                if block_nr < len(blocks):
+                    offset = bisect_left(blocks[block_nr], value)
+                    if blocks[block_nr][offset] == value:
+                        self._delete(block_nr, offset)
+                        return
+        elif self._reversed:
+            for block_nr in range(len(blocks) - 1, -1, -1):
+                block = blocks[block_nr]
+                if value in block:
+                    self._delete(block_nr, len(block) - 1 - block[::-1].index(value))
+                    return
+        else:
+            for block_nr, block in enumerate(blocks):
+                if value in block:
+                    self._delete(block_nr, block.index(value))
+                    return
+        raise ValueError("list.remove(x): x not in list")
+
+    def pop(self, index: int = -1, /) -> int:
+        """Removes and returns the value at index, the last one by default.
+
+        :param int index: The logical position.
+        :return int: The removed value.
+
+        Raises:
+            IndexError: If the list is empty or the index is out of range.
+        """
+
+        if not self._len:
+            raise IndexError("pop from empty list")
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("pop index out of range")
+        position = self._len - 1 - index if self._reversed else index
+        return self._delete(*self._locate(position))
+
+    def sort(self) -> None:
+        """Sorts the values in ascending order. Free if already sorted."""
+
+        if self._sorted and not self._reversed:
+            return
+        if self._sorted:
+            # Ascending physically, so only the view flips.
+            self._reversed = False
+            return
+        values = [value for block in self._blocks for value in block]
+        values.sort()
+        self._load(values)
+        self._reversed = False
+        self._sorted = True
+
+    def reverse(self) -> None:
+        """Reverses the values in O(1) by flipping the reading direction."""
+
+        self._reversed = not self._reversed
+
+COMMANDS: dict[str, Callable[..., object]] = {
+    "insert": BlockList.insert,
+    "remove": BlockList.remove,
+    "append": BlockList.append,
+    "sort": BlockList.sort,
+    "pop": BlockList.pop,
+    "reverse": BlockList.reverse,
+}
+
+# The same table keyed by the raw command bytes, for the batch mode.
+_BYTE_COMMANDS: dict[bytes, Callable[..., object]] = {
+    name.encode('ascii'): command for name, command in COMMANDS.items()
+}
+
+SNAPSHOT_MODES = ("full", "hash", "diff")
+
+def _diff(previous: list[int], current: list[int]) -> bytes:
+    """Describes current as an edit of previous.
+
+    The output is "start removed [inserted, ...]": replace the removed values
+    from start on with the inserted ones. Unchanged snapshots give "=".
+    """
+
+    if previous == current:
+        return b"=\n"
+    limit = min(len(previous), len(current))
+    start = 0
+    while start < limit and previous[start] == current[start]:
+        start += 1
+    end = 0
+    while end < limit - start and previous[-1 - end] == current[-1 - end]:
+        end += 1
+    inserted = current[start:len(current) - end]
+    return f"{start} {len(previous) - start - end} {inserted!r}\n".encode('ascii')
+
+def run_batch(
+    source: BinaryIO,
+    sink: BinaryIO,
+    snapshot: str = "full",
+    block_size: int = 1 << 20) -> None:
+    """Replays a command file, reading and writing in large blocks.
+
+    The input has the same format as the interactive mode. Commands are
+    dispatched through COMMANDS and the output is accumulated and written
+    once per block_size bytes.
+
+    :param BinaryIO source: The command file.
+    :param BinaryIO sink: Where to write the output.
+    :param str snapshot: How to render print: "full" writes the list like the
+        interactive mode, "hash" writes a BLAKE2b digest of it and "diff"
+        writes the first list in full and then only what changed (see _diff).
+    :param int block_size: The read and write block size in bytes.
+
+    Raises:
+        ValueError: If the snapshot mode is unknown or the command count is < 1.
+    """
+
+    if snapshot not in SNAPSHOT_MODES:
+        raise ValueError(f"Snapshot mode must be one of {', '.join(SNAPSHOT_MODES)}.")
+
+    lines = read_tokens(source, block_size, b"\n")
+    N = int(next(lines))
+    validate(N)
+
+    array = BlockList()
+    previous: list[int] | None = None
+    output = bytearray()
+    for line in islice(lines, N):
+        name, *arguments = line.split() or [b""]
+        if name == b"print":
+            if snapshot == "diff":
+                current = list(array)
+                if previous is None:
+                    output += repr(current).encode('ascii') + b"\n"
+                else:
+                    output += _diff(previous, current)
+                previous = current
+            elif snapshot == "hash":
+                output += blake2b(repr(array).encode('ascii'), digest_size=16).hexdigest().encode('ascii') + b"\n"
+            else:
+                output += repr(array).encode('ascii') + b"\n"
+        elif (command := _BYTE_COMMANDS.get(name)) is not None:
+            command(array, *map(int, arguments))
+        else:
+            output += b"Unexpected input. Try again.\n"
+        if len(output) >= block_size:
+            sink.write(output)
+            output.clear()
+    sink.write(output)
+    sink.flush()
+
+def main() -> None:
+    """Reads the commands one by one and prints the list on request."""
+
     N: int = int(input())
     validate(N)
-    user_input: list = []
-    array: list = []
+    array: BlockList = BlockList()
     for _ in range(N):
-        user_input = input().strip().split()
-        if user_input[0] == "insert":
-            array.insert(int(user_input[1]), int(user_input[2]))
-        elif user_input[0] == "print":
+        name, *arguments = input().strip().split()
+        if name == "print":
             print(array)
-        elif user_input[0] == "remove":
-            array.remove(int(user_input[1]))
-        elif user_input[0] == "append":
-            array.append(int(user_input[1]))
-        elif user_input[0] == "sort":
-            array.sort()
-        elif user_input[0] == "pop":
-            array.pop()
-        elif user_input[0] == "reverse":
-            array.reverse()
+        elif name in COMMANDS:
+            COMMANDS[name](array, *map(int, arguments))
         else:
             print("Unexpected input. Try again.")
+
+if __name__ == '__main__' and '--batch' in sys.argv[1:]:
+    modes = [argument.partition("=")[2] for argument in sys.argv[1:] if argument.startswith("--snapshot=")]
+    run_batch(sys.stdin.buffer, sys.stdout.buffer, *modes[-1:])
+elif __name__ == '__main__':
+    main()
@@ -3,7 +3,9 @@
     https://www.hackerrank.com/challenges/python-loops/problem
     """
 
+from fast_output import squares, write_integers
+
 if __name__ == '__main__':
     n = int(input())
-    for i in range(n):
-        print(i**2)
+    if n > 0:
+        write_integers(squares(n), '\n', '\n')
@@ -3,6 +3,19 @@
     https://www.hackerrank.com/challenges/python-mutations/problem
     """
 
+import random
+import sys
+import timeit
+from collections.abc import Iterable
+
+def _validate_edit(length: int, position: int, character: str, /) -> None:
+    """Validates one replacement in a text of the given length, like validate."""
+
+    if not 0 < position < length:
+        raise IndexError(f"Position {position} out of range.")
+    if len(character) != 1:
+        raise ValueError("Character must be a single string.")
+
 def validate(string: str, position: int, character: str, /) -> None:
     """Validates the user input.
 
@@ -16,10 +29,7 @@ def validate(string: str, position: int, character: str, /) -> None:
         ValueError: If the character string is not a single character.
     """
 
-    if not 0 < position < len(string):
-        raise IndexError(f"Position {position} out of range.")
-    if len(character) != 1:
-        raise ValueError("Character must be a single string.")
+    _validate_edit(len(string), position, character)
 
 def mutate_string(string: str, position: int, character: str, /) -> str:
     """Replaces the character at the given position with the given character
@@ -39,7 +49,320 @@ def mutate_string(string: str, position: int, character: str, /) -> str:
     validate(string, position, character)
     return string[:position] + character + string[position + 1:]
 
-if __name__ == '__main__':
+def mutate_batch(string: str, edits: Iterable[tuple[int, str]], /) -> str:
+    """Applies many single character replacements in one pass over a buffer.
+
+    Edits are applied in order, so when several edits target the same
+    position the last one wins.
+
+    Args:
+        string (str): The string where the characters will be replaced in.
+        edits (Iterable[tuple[int, str]]): The (position, character) pairs to apply.
+
+    Returns:
+        str: The modified string.
+
+    Examples:
+        >>> mutate_batch("abracadabra", [(5, 'k'), (1, 'x'), (5, 'z')])
+        'axraczdabra'
+    """
+
+    assert isinstance(string, str), "Expected a string."
+    document = MutableDocument(string)
+    document.apply(edits)
+    return str(document)
+
+class MutableDocument:
+    """A string that supports many cheap character replacements.
+
+    The characters are kept in a list buffer, so each edit is O(1) and the
+    string is only rebuilt when it is materialized with str(). The last
+    materialization is cached until the next edit.
+
+    Examples:
+        >>> document = MutableDocument("abracadabra")
+        >>> document[5] = 'k'
+        >>> document.apply([(1, 'x'), (2, 'y')])
+        >>> str(document)
+        'axyackdabra'
+    """
+
+    __slots__ = ('_buffer', '_cache')
+
+    def __init__(self, string: str, /) -> None:
+        assert isinstance(string, str), "Expected a string."
+        self._buffer: list[str] = list(string)
+        self._cache: str | None = string
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __getitem__(self, position: int, /) -> str:
+        return self._buffer[position]
+
+    def __setitem__(self, position: int, character: str, /) -> None:
+        assert isinstance(position, int), "Expected an integer."
+        assert isinstance(character, str), "Expected a string."
+        _validate_edit(len(self._buffer), position, character)
+        self._buffer[position] = character
+        self._cache = None
+
+    def __str__(self) -> str:
+        if self._cache is None:
+            self._cache = ''.join(self._buffer)
+        return self._cache
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def apply(self, edits: Iterable[tuple[int, str]], /) -> None:
+        """Applies the given edits in order. The last edit to a position wins.
+
+        All edits are validated before any is written, so an invalid edit
+        leaves the document unchanged.
+
+        Args:
+            edits (Iterable[tuple[int, str]]): The (position, character) pairs to apply.
+
+        Raises:
+            IndexError: Position is out of the range 0 < position < len(string).
+            ValueError: If a character string is not a single character.
+        """
+
+        edits = list(edits)
+        length = len(self._buffer)
+        for position, character in edits:
+            _validate_edit(length, position, character)
+        if not edits:
+            return
+        buffer = self._buffer
+        for position, character in edits:
+            buffer[position] = character
+        self._cache = None
+
+class _Piece:
+    """A treap node viewing source[start:start + length] of the original or an inserted string."""
+
+    __slots__ = ('source', 'start', 'length', 'size', 'priority', 'left', 'right')
+
+    def __init__(self, source: str, start: int = 0, length: int | None = None, /) -> None:
+        self.source: str = source
+        self.start: int = start
+        self.length: int = len(source) - start if length is None else length
+        self.size: int = self.length
+        self.priority: float = random.random()
+        self.left: _Piece | None = None
+        self.right: _Piece | None = None
+
+    def text(self) -> str:
+        if self.start == 0 and self.length == len(self.source):
+            return self.source
+        return self.source[self.start:self.start + self.length]
+
+    def update(self) -> '_Piece':
+        self.size = (self.length
+                     + (self.left.size if self.left else 0)
+                     + (self.right.size if self.right else 0))
+        return self
+
+def _merge(left: _Piece | None, right: _Piece | None, /) -> _Piece | None:
+    """Concatenates two treaps."""
+
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return left.update()
+    right.left = _merge(left, right.left)
+    return right.update()
+
+def _split(node: _Piece | None, position: int, /) -> tuple[_Piece | None, _Piece | None]:
+    """Splits a treap into the text before and from the given position."""
+
+    if node is None:
+        return None, None
+    left_size = node.left.size if node.left else 0
+    if position <= left_size:
+        left, node.left = _split(node.left, position)
+        return left, node.update()
+    position -= left_size
+    if position < node.length:
+        # The split falls inside this piece, cut it in two views of the same source.
+        tail = _Piece(node.source, node.start + position, node.length - position)
+        tail.priority = node.priority
+        tail.right, node.right = node.right, None
+        node.length = position
+        return node.update(), tail.update()
+    node.right, right = _split(node.right, position - node.length)
+    return node.update(), right
+
+class TextBuffer:
+    """A piece table text buffer for high frequency edits on large strings.
+
+    The text is stored as pieces, views into the original string or into
+    inserted strings, kept in a randomized balanced tree (treap). Cutting a
+    piece never copies text, so insert, delete, replace and index are
+    O(log n) expected instead of the O(n) copy of an immutable str. The full
+    string is only built when the buffer is materialized with str(), and is
+    cached until the next edit.
+
+    Examples:
+        >>> buffer = TextBuffer("abracadabra")
+        >>> buffer.replace(5, 'k')
+        >>> buffer.insert(0, ">> ")
+        >>> buffer.delete(4, 3)
+        >>> str(buffer), len(buffer), buffer[3]
+        ('>> ackdabra', 11, 'a')
+    """
+
+    __slots__ = ('_root', '_cache')
+
+    def __init__(self, string: str = '', /) -> None:
+        assert isinstance(string, str), "Expected a string."
+        self._root: _Piece | None = _Piece(string) if string else None
+        self._cache: str | None = string
+
+    def __len__(self) -> int:
+        return self._root.size if self._root else 0
+
+    def __getitem__(self, position: int, /) -> str:
+        assert isinstance(position, int), "Expected an integer."
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError(f"Position {position} out of range.")
+        node = self._root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if position < left_size:
+                node = node.left
+                continue
+            position -= left_size
+            if position < node.length:
+                return node.source[node.start + position]
+            position -= node.length
+            node = node.right
+
+    def __str__(self) -> str:
+        if self._cache is None:
+            chunks: list[str] = []
+            stack: list[_Piece] = []
+            node = self._root
+            while stack or node is not None:
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+                node = stack.pop()
+                chunks.append(node.text())
+                node = node.right
+            self._cache = ''.join(chunks)
+        return self._cache
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def insert(self, position: int, text: str, /) -> None:
+        """Inserts text before the given position.
+
+        Args:
+            position (int): Where to insert, 0 <= position <= len(buffer).
+            text (str): The text to insert.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+
+        assert isinstance(position, int), "Expected an integer."
+        assert isinstance(text, str), "Expected a string."
+        if not 0 <= position <= len(self):
+            raise IndexError(f"Position {position} out of range.")
+        if not text:
+            return
+        left, right = _split(self._root, position)
+        self._root = _merge(_merge(left, _Piece(text)), right)
+        self._cache = None
+
+    def delete(self, position: int, length: int = 1, /) -> None:
+        """Deletes length characters starting at the given position.
+
+        Args:
+            position (int): The first character to delete.
+            length (int, optional): How many characters to delete. Defaults to 1.
+
+        Raises:
+            IndexError: If the range is not contained in the buffer.
+        """
+
+        assert isinstance(position, int), "Expected an integer."
+        assert isinstance(length, int), "Expected an integer."
+        if position < 0 or length < 0 or position + length > len(self):
+            raise IndexError(f"Range {position}:{position + length} out of range.")
+        if not length:
+            return
+        left, rest = _split(self._root, position)
+        _, right = _split(rest, length)
+        self._root = _merge(left, right)
+        self._cache = None
+
+    def replace(self, position: int, character: str, /) -> None:
+        """Replaces the character at the given position, like mutate_string.
+
+        Args:
+            position (int): The position of the character to be replaced.
+            character (str): The character to insert.
+
+        Raises:
+            IndexError: Position is out of the range 0 < position < len(buffer).
+            ValueError: If the character string is not a single character.
+        """
+
+        assert isinstance(position, int), "Expected an integer."
+        assert isinstance(character, str), "Expected a string."
+        _validate_edit(len(self), position, character)
+        left, rest = _split(self._root, position)
+        _, right = _split(rest, 1)
+        self._root = _merge(_merge(left, _Piece(character)), right)
+        self._cache = None
+
+def benchmark(size: int = 1_000_000, edits: int = 1_000, /) -> dict[str, float]:
+    """Times repeated mutate_string calls against TextBuffer.replace.
+
+    Args:
+        size (int, optional): Length of the document. Defaults to 1_000_000.
+        edits (int, optional): Number of single character edits. Defaults to 1_000.
+
+    Returns:
+        dict[str, float]: Seconds taken by each approach.
+    """
+
+    rng = random.Random(0)
+    document = 'a' * size
+    plan = [(rng.randrange(1, size), rng.choice('bcd')) for _ in range(edits)]
+
+    def run_mutate_string() -> str:
+        string = document
+        for position, character in plan:
+            string = mutate_string(string, position, character)
+        return string
+
+    def run_text_buffer() -> str:
+        buffer = TextBuffer(document)
+        for position, character in plan:
+            buffer.replace(position, character)
+        return str(buffer)
+
+    assert run_mutate_string() == run_text_buffer()
+    return {
+        'mutate_string': timeit.timeit(run_mutate_string, number=1),
+        'TextBuffer': timeit.timeit(run_text_buffer, number=1),
+    }
+
+if __name__ == '__main__' and '--benchmark' in sys.argv[1:]:
+    for name, seconds in benchmark().items():
+        print(f"{name:>14}: {seconds:.3f}s")
+elif __name__ == '__main__':
     s = input()
     i, c = input().split()
     s_new = mutate_string(s, int(i), c)
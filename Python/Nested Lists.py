@@ -3,15 +3,90 @@
     https://www.hackerrank.com/challenges/nested-list/problem
     """
 
-from operator import itemgetter
+from collections.abc import Iterable, Iterator
+from heapq import heappush, heappushpop
+
+def read_records(count: int, /) -> Iterator[tuple[str, float]]:
+    """Reads count (name, grade) records from the standard input, one at a time.
+
+    Args:
+        count (int): The amount of records.
+
+    Returns:
+        Iterator[tuple[str, float]]: The records.
+    """
+
+    for _ in range(count):
+        yield input(), float(input())
+
+def second_lowest(records: Iterable[tuple[str, float]], /) -> list[str]:
+    """Returns the names with the second lowest grade, in alphabetical order.
+
+    Only the two lowest distinct grades and the names tied to them are kept
+    while reading, so memory is O(ties) instead of O(n).
+
+    Args:
+        records (Iterable[tuple[str, float]]): The (name, grade) records.
+
+    Raises:
+        ValueError: If there are less than two distinct grades.
+
+    Returns:
+        list[str]: The sorted names.
+    """
+
+    lowest = second = None
+    lowest_names: list[str] = []
+    second_names: list[str] = []
+    for name, grade in records:
+        if lowest is None or grade < lowest:
+            second, second_names = lowest, lowest_names
+            lowest, lowest_names = grade, [name]
+        elif grade == lowest:
+            lowest_names.append(name)
+        elif second is None or grade < second:
+            second, second_names = grade, [name]
+        elif grade == second:
+            second_names.append(name)
+    if second is None:
+        raise ValueError("Expected at least 2 distinct grades.")
+    return sorted(second_names)
+
+def kth_lowest(records: Iterable[tuple[str, float]], k: int, /) -> tuple[float, list[str]]:
+    """Returns the k-th lowest distinct grade and the names with it.
+
+    A bounded max-heap keeps the k lowest distinct grades seen so far, along
+    with the names tied to each of them, so memory is O(k + ties).
+
+    Args:
+        records (Iterable[tuple[str, float]]): The (name, grade) records.
+        k (int): The rank of the grade, 1 for the lowest.
+
+    Raises:
+        ValueError: If k < 1 or there are less than k distinct grades.
+
+    Returns:
+        tuple[float, list[str]]: The grade and the sorted names.
+    """
+
+    if k < 1:
+        raise ValueError("k must be a positive integer.")
+    # Grades are negated, so the heap top is the highest of the kept grades.
+    heap: list[float] = []
+    names: dict[float, list[str]] = {}
+    for name, grade in records:
+        if grade in names:
+            names[grade].append(name)
+        elif len(heap) < k:
+            heappush(heap, -grade)
+            names[grade] = [name]
+        elif grade < -heap[0]:
+            del names[-heappushpop(heap, -grade)]
+            names[grade] = [name]
+    if len(heap) < k:
+        raise ValueError(f"Expected at least {k} distinct grades.")
+    return -heap[0], sorted(names[-heap[0]])
 
 if __name__ == '__main__':
-    records = []
-    for _ in range(int(input())):
-        records.append([input(), float(input())])
-    
-    records = sorted(records, key=itemgetter(0))
-    slg = sorted(list(set(grade[1] for grade in records)))[1]
-    for record in records:
-        if record[1] == slg:
-            print(record[0])
+    for name in second_lowest(read_records(int(input()))):
+        print(name)
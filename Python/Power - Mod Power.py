@@ -3,7 +3,141 @@
     https://www.hackerrank.com/challenges/python-power-mod-power/problem
     """
 
-if __name__ == '__main__':
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TextIO
+
+class FixedBasePowers:
+    """Modular powers of one base, sped up with a precomputed window table.
+
+    Row i of the table holds base^(j * 2^(window * i)) mod m for every window
+    digit j, so a power only needs one multiplication per non-zero digit of
+    the exponent instead of one squaring per bit. Rows are built lazily, as
+    larger exponents need them.
+    """
+
+    def __init__(self, base: int, modulus: int, window: int = 4, /) -> None:
+        """
+        Args:
+            base (int): The base.
+            modulus (int): The modulus, not 0.
+            window (int, optional): Exponent bits per table row. Defaults to 4.
+        """
+
+        self.modulus = modulus
+        self.window = window
+        self._rows: list[list[int]] = [self._row(base % modulus)]
+
+    def _row(self, base: int, /) -> list[int]:
+        row = [1 % self.modulus]
+        for _ in range((1 << self.window) - 1):
+            row.append(row[-1] * base % self.modulus)
+        return row
+
+    def pow(self, exponent: int, /) -> int:
+        """Returns pow(base, exponent, modulus) for exponent >= 0."""
+
+        rows, modulus, window = self._rows, self.modulus, self.window
+        mask = (1 << window) - 1
+        result = 1 % modulus
+        i = 0
+        while exponent:
+            if i == len(rows):
+                last = rows[-1]
+                rows.append(self._row(last[-1] * last[1] % modulus))
+            digit = exponent & mask
+            if digit:
+                result = result * rows[i][digit] % modulus
+            exponent >>= window
+            i += 1
+        return result
+
+# A window table only pays off for big moduli queried many times with one base.
+TABLE_MIN_QUERIES: int = 16
+TABLE_MIN_BITS: int = 256
+
+def mod_powers(queries: Iterable[tuple[int, int, int]], /) -> list[int]:
+    """Computes pow(a, b, m) for many (a, b, m) triples.
+
+    Repeated triples are computed once. Triples sharing a base and a big
+    modulus are grouped and answered from one FixedBasePowers table, the
+    rest fall back to the built in pow.
+
+    Args:
+        queries (Iterable[tuple[int, int, int]]): The (a, b, m) triples.
+
+    Returns:
+        list[int]: The modular powers, in query order.
+    """
+
+    queries = list(queries)
+    groups: defaultdict[tuple[int, int], set[int]] = defaultdict(set)
+    for a, b, m in queries:
+        if b >= 0 and m:
+            groups[a % m, m].add(b)
+
+    answers: dict[tuple[int, int, int], int] = {}
+    for (a, m), exponents in groups.items():
+        if len(exponents) >= TABLE_MIN_QUERIES and m.bit_length() >= TABLE_MIN_BITS:
+            table = FixedBasePowers(a, m, 8 if len(exponents) >= 256 else 4)
+            for b in exponents:
+                answers[a, b, m] = table.pow(b)
+
+    results: list[int] = []
+    for a, b, m in queries:
+        key = (a % m, b, m) if m else (a, b, m)
+        if key not in answers:
+            answers[key] = pow(a, b, m)
+        results.append(answers[key])
+    return results
+
+def power_pairs(queries: Iterable[tuple[int, int, int]], full: bool = False, /) -> list[tuple[int | None, int]]:
+    """Computes (pow(a, b), pow(a, b, m)) for many triples.
+
+    The full power can have millions of digits, so it is only computed when
+    asked for.
+
+    Args:
+        queries (Iterable[tuple[int, int, int]]): The (a, b, m) triples.
+        full (bool, optional): Whether to compute pow(a, b) too. Defaults to False.
+
+    Returns:
+        list[tuple[int | None, int]]: The full power, or None, and the modular power.
+    """
+
+    queries = list(queries)
+    modular = mod_powers(queries)
+    if not full:
+        return [(None, power) for power in modular]
+    return [(pow(a, b), power) for (a, b, _), power in zip(queries, modular)]
+
+def stream(source: TextIO, sink: TextIO, full: bool = False, batch_size: int = 4096, /) -> None:
+    """Answers "a b m" lines from source, batch_size lines at a time.
+
+    Each answer is written on its own line: "pow(a, b, m)", or
+    "pow(a, b) pow(a, b, m)" when full is set.
+
+    Args:
+        source (TextIO): The query lines. Blank lines are skipped.
+        sink (TextIO): Where to write the answers.
+        full (bool, optional): Whether to write pow(a, b) too. Defaults to False.
+        batch_size (int, optional): Lines per batch. Defaults to 4096.
+    """
+
+    triples: Iterator[tuple[int, int, int]] = (
+        tuple(map(int, line.split())) for line in source if not line.isspace())
+    while batch := list(islice(triples, batch_size)):
+        answers = power_pairs(batch, full)
+        if full:
+            sink.write(''.join(f"{power} {modular}\n" for power, modular in answers))
+        else:
+            sink.write(''.join(f"{modular}\n" for _, modular in answers))
+
+if __name__ == '__main__' and '--batch' in sys.argv[1:]:
+    stream(sys.stdin, sys.stdout, '--full' in sys.argv[1:])
+elif __name__ == '__main__':
     a = int(input())
     b = int(input())
     m = int(input())
@@ -3,6 +3,8 @@
     https://www.hackerrank.com/challenges/python-print/problem
     """
 
+from fast_output import write_integers
+
 if __name__ == '__main__':
     n = int(input())
-    print(*range(1,n+1), sep='')
+    write_integers(range(1,n+1), '')
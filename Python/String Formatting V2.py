@@ -3,6 +3,12 @@
     https://www.hackerrank.com/challenges/python-string-formatting/problem
     """
 
+import os
+import sys
+import timeit
+from collections.abc import Iterator
+from typing import BinaryIO
+
 def validate(number: int) -> None:
     """Validates the input.
     
@@ -23,13 +29,11 @@ def to_octal(number: int) -> int:
     :return int: The octal conversion.
     """
 
-    octal: int = 0
-    count: int = 0
+    digits: list[str] = []
     while number > 0:
-        octal = (number % 8) * (10 ** count) + octal
-        count += 1
+        digits.append(str(number % 8))
         number = number // 8
-    return octal
+    return int(''.join(reversed(digits)) or '0')
 
 def to_hex(number: int) -> str:
     """Converts the given integer to hexadecimal.
@@ -53,13 +57,11 @@ def to_bin(number: int) -> int:
     :return int: The binary conversion.
     """
 
-    binary: int = 0
-    count: int = 0
+    digits: list[str] = []
     while number > 0:
-        binary = (number % 2) * (10 ** count) + binary
-        count += 1
+        digits.append(str(number % 2))
         number = number // 2
-    return binary
+    return int(''.join(reversed(digits)) or '0')
 
 def print_formatted(number: int) -> None:
     """Prints the numbers from 1 to the given number in decimal, octal, hexadecimal and binary.
@@ -74,6 +76,119 @@ def print_formatted(number: int) -> None:
     for decimal in range(1, number + 1):
         print(f"{decimal:>{col_w}} {to_octal(decimal):>{col_w}} {to_hex(decimal):>{col_w}} {to_bin(decimal):>{col_w}}")
 
-if __name__ == '__main__':
+def _successors(digits: str) -> list[int]:
+    """Builds a byte lookup table mapping each digit to the next one.
+
+    The highest digit maps to '0' (the caller carries) and the space used
+    for padding maps to '1', so a number can grow into its padding.
+    """
+
+    table = list(range(256))
+    table[ord(' ')] = ord('1')
+    for digit, successor in zip(digits, digits[1:]):
+        table[ord(digit)] = ord(successor)
+    table[ord(digits[-1])] = ord('0')
+    return table
+
+_DECIMAL = _successors("0123456789")
+_OCTAL = _successors("01234567")
+_HEXADECIMAL = _successors("0123456789ABCDEF")
+_BINARY = _successors("01")
+
+def render_range(start: int, stop: int, col_w: int, block_rows: int = 1 << 16) -> Iterator[bytes]:
+    """Renders the table rows for start <= decimal < stop in blocks.
+
+    Only the first row is converted with format; every following row is
+    obtained by incrementing the decimal, octal, hexadecimal and binary
+    digits of the previous row in place with carry propagation, which is
+    amortized O(1) digit work per row. Ranges are independent from each
+    other, so a table can be split in [start, stop) shards and rendered by
+    separate processes as long as they all use the same col_w.
+
+    :param int start: the first number to render. Positive.
+    :param int stop: the number after the last one to render.
+    :param int col_w: the column width, len(bin(number)) - 2 for a full table.
+    :param int block_rows: the amount of rows per yielded block.
+    :return Iterator[bytes]: the rendered blocks, in order.
+    """
+
+    validate(start)
+    if (stop - 1).bit_length() > col_w:
+        raise ValueError("Column width too small for the range.")
+
+    row = bytearray(f"{start:>{col_w}} {start:>{col_w}o} {start:>{col_w}X} {start:>{col_w}b}\n", 'ascii')
+    # Index of the last digit of each column, its successor table and its highest digit.
+    columns = (
+        (col_w - 1, _DECIMAL, ord('9')),
+        (2 * col_w, _OCTAL, ord('7')),
+        (3 * col_w + 1, _HEXADECIMAL, ord('F')),
+        (4 * col_w + 2, _BINARY, ord('1')),
+    )
+
+    for block_start in range(start, stop, block_rows):
+        block = bytearray()
+        for _ in range(block_start, min(block_start + block_rows, stop)):
+            block += row
+            for index, successors, highest in columns:
+                while True:
+                    digit = row[index]
+                    row[index] = successors[digit]
+                    if digit != highest:
+                        break
+                    index -= 1
+        yield bytes(block)
+
+def write_formatted(number: int, stream: BinaryIO | None = None, block_rows: int = 1 << 16) -> None:
+    """Writes the same table as print_formatted through one buffered writer.
+
+    Rows are rendered by render_range in blocks of block_rows and each block
+    is written with a single call, which avoids one print call per row.
+
+    :param int number: the maximum number to print.
+    :param BinaryIO stream: the binary stream to write to. Defaults to sys.stdout.buffer.
+    :param int block_rows: the amount of rows rendered per write.
+    """
+
+    validate(number)
+
+    if stream is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+
+    for block in render_range(1, number + 1, number.bit_length(), block_rows):
+        stream.write(block)
+    stream.flush()
+
+def benchmark(exponents: range = range(3, 8), baseline_limit: int = 10 ** 5) -> dict[int, dict[str, float]]:
+    """Times print_formatted against write_formatted for n = 10^3..10^7.
+
+    print_formatted is only timed up to baseline_limit, as it takes minutes past that.
+
+    :param range exponents: the powers of ten to time.
+    :param int baseline_limit: the largest n to time print_formatted with.
+    :return dict[int, dict[str, float]]: seconds taken by each approach, per n.
+    """
+
+    results: dict[int, dict[str, float]] = {}
+    stdout = sys.stdout
+    with open(os.devnull, 'w') as devnull:
+        for exponent in exponents:
+            number = 10 ** exponent
+            timings: dict[str, float] = {}
+            if number <= baseline_limit:
+                sys.stdout = devnull
+                try:
+                    timings['print_formatted'] = timeit.timeit(lambda: print_formatted(number), number=1)
+                finally:
+                    sys.stdout = stdout
+            timings['write_formatted'] = timeit.timeit(
+                lambda: write_formatted(number, devnull.buffer), number=1)
+            results[number] = timings
+    return results
+
+if __name__ == '__main__' and '--benchmark' in sys.argv[1:]:
+    for n, timings in benchmark().items():
+        print(f"n={n:<10}", *(f"{name}: {seconds:.3f}s" for name, seconds in timings.items()))
+elif __name__ == '__main__':
     n = int(input())
-    print_formatted(n)
+    write_formatted(n)
@@ -3,25 +3,65 @@
     https://www.hackerrank.com/challenges/text-alignment/problem
     """
 
-thickness = int(input()) #This must be an odd number
-c = 'H'
+import sys
+from functools import lru_cache
 
-#Top Cone
-for i in range(thickness):
-    print((c*i).rjust(thickness-1)+c+(c*i).ljust(thickness-1))
+def validate(thickness: int, char: str) -> None:
+    """Validates the logo's parameters.
 
-#Top Pillars
-for i in range(thickness+1):
-    print((c*thickness).center(thickness*2)+(c*thickness).center(thickness*6))
+    :param int thickness: The logo's thickness.
+    :param str char: The character the logo is drawn with.
 
-#Middle Belt
-for i in range((thickness+1)//2):
-    print((c*thickness*5).center(thickness*6))    
+    Raises:
+        ValueError: If thickness is not a positive odd number or char is not a single character.
+    """
+
+    if thickness < 1 or thickness % 2 == 0:
+        raise ValueError("Thickness must be a positive odd number.")
+    if len(char) != 1:
+        raise ValueError("The logo must be drawn with a single character.")
+
+@lru_cache(maxsize=64)
+def render_logo(thickness: int, char: str = 'H') -> str:
+    """Renders the whole logo, one line per row.
+
+    Each distinct row is built once: the pillar and belt rows are repeated
+    by reference and the bottom cone reuses the top cone's rows, shifted.
+    Logos are cached by their parameters.
+
+    :param int thickness: The logo's thickness. Odd number.
+    :param str char: The character the logo is drawn with.
+    :return str: The logo, with a trailing new line.
+
+    Examples:
+        >>> render_logo(1).splitlines()
+        ['H', 'H   H   ', 'H   H   ', 'HHHHH ', 'H   H   ', 'H   H   ', '    H ']
+    """
+
+    validate(thickness, char)
+
+    # Top Cone
+    cone = [(char * i).rjust(thickness - 1) + char + (char * i).ljust(thickness - 1) + '\n'
+            for i in range(thickness)]
+
+    # Pillars
+    pillar = (char * thickness).center(thickness * 2) + (char * thickness).center(thickness * 6) + '\n'
+    pillars = [pillar] * (thickness + 1)
+
+    # Middle Belt
+    belt = [(char * thickness * 5).center(thickness * 6) + '\n'] * ((thickness + 1) // 2)
+
+    # Bottom Cone, the top cone upside down and right aligned
+    shift = ' ' * (thickness * 4)
+    bottom = [shift + row[:-1] + ' \n' for row in reversed(cone)]
+
+    return ''.join(cone + pillars + belt + pillars + bottom)
+
+def main():
+    """Main function to read the thickness and print the logo."""
 
-#Bottom Pillars
-for i in range(thickness+1):
-    print((c*thickness).center(thickness*2)+(c*thickness).center(thickness*6))    
+    thickness = int(input())
+    sys.stdout.write(render_logo(thickness))
 
-#Bottom Cone
-for i in range(thickness):
-    print(((c*(thickness-i-1)).rjust(thickness)+c+(c*(thickness-i-1)).ljust(thickness)).rjust(thickness*6))
+if __name__ == '__main__':
+    main()
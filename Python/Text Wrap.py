@@ -3,12 +3,379 @@
     https://www.hackerrank.com/challenges/text-wrap/problem
     """
 
+import io
+import os
+import random
+import re
+import sys
 import textwrap
+import timeit
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+# textwrap's whitespace, which it turns into spaces before splitting.
+_WHITESPACE = str.maketrans('\t\n\x0b\x0c\r', '     ')
+_NON_SPACE = re.compile(r'[^ ]')
+# Hyphens and whitespace other than spaces need textwrap's exact chunking.
+_SPECIAL = re.compile(r'[^\S ]|-')
+# Splits hyphenated words and em-dashes exactly like textwrap.fill does.
+_WORDSEP = textwrap.TextWrapper.wordsep_re
+# The pieces textwrap builds _WORDSEP from, which it does not expose. _matches_textwrap
+# checks that they still add up to the running textwrap's _WORDSEP.
+_PATTERNS = {'wp': r'[\w!"\'&.,?]', 'lt': r'[^\d\W]', 'ws': '[%s]' % re.escape('\t\n\x0b\x0c\r '),
+             'nws': '[^%s]' % re.escape('\t\n\x0b\x0c\r ')}
+_WORD_END = r"""
+        -(?: (?<=%(lt)s{2}-) | (?<=%(lt)s-%(lt)s-)) (?= %(lt)s -? %(lt)s)
+      | (?=%(ws)s|\Z)
+      | (?<=%(wp)s) (?=-{2,}\w)
+    """ % _PATTERNS
+_EM_DASH_PATTERN = r'(?<=%(wp)s) -{2,} (?=\w)' % _PATTERNS
+# The rest of a word chunk textwrap cut, up to where _WORDSEP would have ended it.
+_WORD_REST = re.compile('%s*? (?:%s)' % (_PATTERNS['nws'], _WORD_END), re.VERBOSE)
+_EM_DASH = re.compile(_EM_DASH_PATTERN, re.VERBOSE)
+_DASHES = re.compile(r'-*')
+
+# Where a line starts: on a chunk boundary, or in the rest of a cut word or em-dash.
+_BOUNDARY, _IN_WORD, _IN_DASH = range(3)
+
+def _matches_textwrap() -> bool:
+    """Checks that the copied pieces rebuild the running textwrap's word splitter.
+
+    Both patterns are compared without their verbose mode comments and
+    whitespace.
+
+    >>> _matches_textwrap()
+    True
+    """
+
+    def squeeze(pattern: str) -> str:
+        return re.sub(r'\s+', '', re.sub(r'#[^\n]*', '', pattern))
+
+    rebuilt = r'(%s+ | %s | %s+? (?:%s))' % (
+        _PATTERNS['ws'], _EM_DASH_PATTERN, _PATTERNS['nws'], _WORD_END)
+    return (squeeze(rebuilt) == squeeze(_WORDSEP.pattern)
+            and re.compile(rebuilt, re.VERBOSE).flags == _WORDSEP.flags)
+
+# When textwrap's splitter changed, the engine below would drift from it silently.
+_EXACT = _matches_textwrap()
+
+class _NeedMore(Exception):
+    """Raised when a line can not be decided without the next block."""
+
+def _normalized_blocks(source: TextIO, block_size: int) -> Iterator[str]:
+    """Yields the blocks of a text stream with tabs expanded and whitespace replaced.
+
+    The tab column is carried across blocks, so the result is the same as
+    normalizing the whole text at once.
+    """
+
+    column = 0
+    while block := source.read(block_size):
+        if '\t' in block:
+            # Pad to the current tab column so expandtabs lines up, then drop the padding.
+            block = ('x' * column + block).expandtabs()[column:]
+        newline = max(block.rfind('\n'), block.rfind('\r'))
+        column = (len(block) - newline - 1 if newline >= 0 else column + len(block)) % 8
+        yield block.translate(_WHITESPACE)
+
+def _find(text: str, found: int, final: bool) -> int:
+    """Turns a failed search into the end of the text, or asks for more of it."""
+
+    if found >= 0:
+        return found
+    if not final:
+        raise _NeedMore()
+    return len(text)
+
+def _run_end(text: str, position: int, final: bool) -> int:
+    """Returns the end of the space run starting at position."""
+
+    match = _NON_SPACE.search(text, position)
+    return match.start() if match else _find(text, -1, final)
+
+def _chunk_end(text: str, position: int, state: int, stop: int) -> int:
+    """Returns the end of textwrap's chunk holding position, looking no further than stop."""
+
+    if state == _IN_WORD:
+        return _WORD_REST.match(text, position, stop).end()
+    if state == _IN_DASH:
+        return _DASHES.match(text, position, stop).end()
+    return _WORDSEP.match(text, position, stop).end()
+
+def _exact_line(text: str, p: int, width: int, final: bool, drop: bool, state: int,
+                dashes: list[int]) -> tuple[int, int, int, int]:
+    """Lays out one line from p following textwrap's chunks exactly.
+
+    Used when hyphens or unusual whitespace are near the line end. Only the
+    chunks of the line's last word and of the word after it are matched, in
+    a view of the next 2 * width + 5 characters, so a line costs O(width).
+
+    :param list[int] dashes: The last hyphen run looked up, as [start, end], reused by the next lines.
+
+    Returns:
+        tuple[int, int, int, int]: The start and end of the line's text, where
+        the next line starts and the state it starts in.
+    """
+
+    n = len(text)
+    if p + 2 * width + 5 >= n and not final:
+        raise _NeedMore()
+    stop = min(p + 2 * width + 5, n)
+    # A few characters before p for the lookbehinds.
+    base = max(p - 4, 0)
+    view = text[base:stop]
+    cutoff = len(view)
+    if stop < n:
+        # Chunks ending past cutoff may have been cut short by stop, they are longer than a line.
+        cutoff -= 4
+        if text[stop - 1] == '-':
+            # The em-dash lookahead reads a whole hyphen run and the character after it,
+            # so the view ends the run early with that character.
+            if not dashes[0] <= stop <= dashes[1]:
+                dashes[:] = stop, _DASHES.match(text, stop).end()
+            if dashes[1] == n and not final:
+                raise _NeedMore()
+            view += '--' + text[dashes[1]:dashes[1] + 1]
+    q = p - base
+    limit = q + width
+
+    if drop and view[q].isspace():
+        end = _chunk_end(view, q, state, len(view))
+        blank = view[q:end].strip() == ''
+        if blank and end > cutoff:
+            # A whitespace chunk is only dropped whole, find where it really ends.
+            end = _chunk_end(text, p, state, n) - base
+            if base + end > n - 4 and not final:
+                raise _NeedMore()
+            blank = text[p:base + end].strip() == ''
+        if blank:
+            if base + end == n:
+                return n, n, n, _BOUNDARY
+            return _exact_line(text, base + end, width, final, False, _BOUNDARY, dashes)
+
+    # The chunks before the line's last word fit whole, start at that word.
+    start = q
+    space = view.rfind(' ', q, limit + 1)
+    if space > q:
+        start = view.rfind(' ', q, q + len(view[q:space].rstrip(' '))) + 1 or q
+    bounds = [q]
+    kind = state
+    if start > q:
+        bounds.append(start)
+        kind = _BOUNDARY
+    position = start
+    while position <= limit and position < len(view):
+        position = _chunk_end(view, position, kind, len(view))
+        kind = _BOUNDARY
+        bounds.append(position)
+        if position > cutoff:
+            break
+
+    # Whole chunks that fit, then the rest of a chunk too long for any line.
+    end = bisect_right(bounds, limit) - 1
+    if end + 1 < len(bounds) and (bounds[end + 1] - bounds[end] > width or bounds[end + 1] > cutoff):
+        chunk_start = bounds[end]
+        if chunk_start == q and state != _BOUNDARY:
+            kind = state
+        elif view[chunk_start] == ' ':
+            kind = _BOUNDARY
+        else:
+            kind = _IN_DASH if _EM_DASH.match(view, chunk_start) else _IN_WORD
+        next_start = limit
+        hyphen = view.rfind('-', chunk_start, limit)
+        if hyphen > chunk_start and view[chunk_start:hyphen].strip('-'):
+            next_start = hyphen + 1
+        if view[chunk_start:next_start].strip() == '':
+            return p, base + chunk_start, base + next_start, kind
+        return p, base + next_start, base + next_start, kind
+    if end and view[bounds[end - 1]:bounds[end]].strip() == '':
+        return p, base + bounds[end - 1], base + bounds[end], _BOUNDARY
+    return p, base + bounds[end], base + bounds[end], _BOUNDARY
+
+def _wrap_text(text: str, p: int, width: int, final: bool, started: bool, state: int,
+               lines: list[str]) -> tuple[int, bool, int]:
+    """Appends the lines that can be decided from text[p:] to lines.
+
+    Most lines are decided with a few searches in the next 2 * width + 2
+    characters, without splitting the text in chunks. Lines whose last word
+    or next word hold hyphens or whitespace other than spaces go through
+    _exact_line.
+
+    Returns:
+        tuple[int, bool, int]: Where to resume, whether a line was written
+        yet and the state to resume in.
+    """
+
+    n = len(text)
+    resume, resume_state = p, state
+    dashes = [1, 0]
+    try:
+        while True:
+            resume, resume_state = p, state
+            drop = started
+            if started and p < n and text[p] == ' ':
+                p = _run_end(text, p, final)
+                drop = False
+            if p >= n:
+                _find(text, -1, final)
+                return n, started, _BOUNDARY
+
+            if p + 2 * width + 5 >= n and not final:
+                raise _NeedMore()
+            limit = p + width
+            # Only the last word of the line and the word after it need exact chunks.
+            last = text.rfind(' ', p, limit + 1)
+            if last > p:
+                last = text.rfind(' ', p, p + len(text[p:last].rstrip(' '))) + 1 or p
+            state = _BOUNDARY
+            if _SPECIAL.search(text, max(last, p), p + 2 * width + 2) or (drop and text[p].isspace()):
+                p, end, next_start, state = _exact_line(text, p, width, final, drop, resume_state, dashes)
+            elif limit >= n:
+                end = p + len(text[p:].rstrip(' '))
+                next_start = n
+            elif text[limit] == ' ':
+                if text[limit - 1] != ' ':
+                    end = next_start = limit
+                else:
+                    end = p + len(text[p:limit].rstrip(' '))
+                    # A space run longer than a line is cut, then dropped.
+                    next_start = limit if _run_end(text, limit, final) - end > width else end
+            else:
+                word_start = text.rfind(' ', p, limit) + 1 or p
+                word_limit = min(word_start + width + 1, n)
+                if text.find(' ', limit, word_limit) < 0 and word_limit - word_start > width:
+                    # A word longer than a line is cut at the line's end.
+                    end = next_start = limit
+                    state = _IN_WORD
+                else:
+                    end = p + len(text[p:word_start].rstrip(' '))
+                    next_start = word_start
+            if end > p:
+                lines.append(text[p:end])
+                started = True
+            p = next_start
+    except _NeedMore:
+        return resume, started, resume_state
+
+def wrap_blocks(blocks: Iterable[str], max_width: int) -> Iterator[str]:
+    """Wraps normalized text blocks into lines like textwrap.fill, in one pass.
+
+    Every block only keeps the unfinished end of the previous one, so the
+    text is scanned once and memory stays at a block and a line. If the
+    running textwrap no longer splits words like the copied patterns, the
+    blocks are joined and wrapped by textwrap instead, which is exact but
+    holds the whole text.
+
+    :param Iterable[str] blocks: The text, with tabs expanded and whitespace replaced.
+    :param int max_width: The maximum line width.
+    :return Iterator[str]: The lines, without new lines.
+
+    Raises:
+        ValueError: If max_width is < 1.
+    """
+
+    if max_width <= 0:
+        raise ValueError(f"invalid width {max_width!r} (must be > 0)")
+    if not _EXACT:
+        yield from textwrap.wrap(''.join(blocks), max_width)
+        return
+
+    text = ''
+    p = 0
+    started = False
+    state = _BOUNDARY
+    lines: list[str] = []
+    for block in blocks:
+        # Keep a few characters before p for textwrap's lookbehinds.
+        keep = max(p - 4, 0)
+        text = text[keep:] + block
+        p, started, state = _wrap_text(text, p - keep, max_width, False, started, state, lines)
+        yield from lines
+        lines.clear()
+    _wrap_text(text, p, max_width, True, started, state, lines)
+    yield from lines
+
+def wrap_lines(source: TextIO, max_width: int, block_size: int = 1 << 20) -> Iterator[str]:
+    """Yields the lines of textwrap.fill(source.read(), max_width) one at a time.
+
+    :param TextIO source: The text to wrap.
+    :param int max_width: The maximum line width.
+    :param int block_size: The read size in characters.
+    :return Iterator[str]: The lines, without new lines.
+    """
+
+    return wrap_blocks(_normalized_blocks(source, block_size), max_width)
+
+def wrap_stream(source: TextIO, sink: TextIO, max_width: int, block_size: int = 1 << 20) -> None:
+    """Writes textwrap.fill(source.read(), max_width) to sink, streaming.
+
+    :param TextIO source: The text to wrap.
+    :param TextIO sink: Where to write the wrapped text. No final new line is added.
+    :param int max_width: The maximum line width.
+    :param int block_size: The read size in characters, also the write size.
+    """
+
+    lines = wrap_lines(source, max_width, block_size)
+    buffer: list[str] = []
+    size = 0
+    separator = ''
+    for line in lines:
+        buffer.append(separator)
+        buffer.append(line)
+        separator = '\n'
+        size += len(line) + 1
+        if size >= block_size:
+            sink.write(''.join(buffer))
+            buffer.clear()
+            size = 0
+    sink.write(''.join(buffer))
 
 def wrap(string: str, max_width: int) -> str:
     return textwrap.fill(string, max_width)
 
-if __name__ == '__main__':
+def benchmark(size: int = 100 * 2 ** 20, max_width: int = 72) -> dict[str, float]:
+    """Times textwrap.fill against wrap_stream on generated documents.
+
+    The prose has a hyphenated word in about one word in a hundred, the
+    hyphenated document in one word in ten, so in most lines, and the
+    dense document is nothing but short hyphenated chunks.
+
+    :param int size: The size of each document in characters. Defaults to 100 MiB.
+    :param int max_width: The maximum line width.
+    :return dict[str, float]: Seconds taken by each approach on each document.
+    """
+
+    rng = random.Random(0)
+    vocabulary = ['the', 'of', 'and', 'a', 'to', 'in', 'he', 'was', 'that', 'it', 'his', 'her',
+                  'with', 'said,', 'had', 'they', 'house.\n', 'morning;', 'remembered',
+                  'suddenly\t', 'extraordinary', 'quiet.\n\n', 'long-forgotten', 'window--and']
+    documents = {}
+    for name, hyphenated in [('prose', 1), ('hyphenated', 10)]:
+        # Hyphenated words are the last two.
+        weights = [100 - hyphenated] * (len(vocabulary) - 2) + [hyphenated * 11] * 2
+        words: list[str] = []
+        length = 0
+        while length < size:
+            word = rng.choices(vocabulary, weights)[0]
+            words.append(word)
+            length += len(word) + 1
+        documents[name] = ' '.join(words)
+    documents['dense'] = 'ab-' * (size // 3)
+
+    timings = {}
+    with open(os.devnull, 'w') as devnull:
+        for name, document in documents.items():
+            timings[f'{name} textwrap.fill'] = timeit.timeit(
+                lambda: devnull.write(textwrap.fill(document, max_width)), number=1)
+            timings[f'{name} wrap_stream'] = timeit.timeit(
+                lambda: wrap_stream(io.StringIO(document), devnull, max_width), number=1)
+    return timings
+
+if __name__ == '__main__' and '--benchmark' in sys.argv[1:]:
+    for name, seconds in benchmark().items():
+        print(f"{name:>25}: {seconds:.3f}s")
+elif __name__ == '__main__':
     string, max_width = input(), int(input())
     result = wrap(string, max_width)
     print(result)
@@ -3,39 +3,110 @@
     https://www.hackerrank.com/challenges/python-tuples/problem
     """
 
-def validate(n, user_input):
-    """Validates the input.
-    
-    :param int n: The input.
-    
+import sys
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from block_input import read_tokens
+
+def read_integers(source: BinaryIO, block_size: int = 1 << 20) -> Iterator[int]:
+    """Yields the whitespace separated integers of a binary stream, reading it in blocks.
+
+    :param BinaryIO source: The stream to read.
+    :param int block_size: The read size in bytes.
+    :return Iterator[int]: The integers, in order.
+
     Raises:
-        ValueError: If the input is < 1.
+        TypeError: If a value is not an integer.
+    """
+
+    try:
+        yield from map(int, read_tokens(source, block_size))
+    except ValueError as e:
+        raise TypeError(f"Expected integers: {e}") from e
+
+class TupleHasher:
+    """Computes hash(tuple(items)) incrementally, without building the tuple.
+
+    This replays CPython's tuple hash (the xxHash based one used since 3.8)
+    one item at a time, so a tuple of millions of integers can be hashed
+    from a stream while holding a single block of it in memory.
+    """
+
+    if sys.hash_info.width == 64:
+        _PRIME_1, _PRIME_2, _PRIME_5, _ROTATE = (
+            11400714785074694791, 14029467366897019727, 2870177450012600261, 31)
+    else:
+        _PRIME_1, _PRIME_2, _PRIME_5, _ROTATE = 2654435761, 2246822519, 374761393, 13
+    _MASK = (1 << sys.hash_info.width) - 1
+
+    def __init__(self, items: Iterable = ()) -> None:
+        self._acc: int = self._PRIME_5
+        self._length: int = 0
+        self.update(items)
+
+    def update(self, items: Iterable) -> None:
+        """Feeds more items, in tuple order.
+
+        :param Iterable items: The items to add.
+        """
+
+        acc, length = self._acc, self._length
+        prime_1, prime_2, mask = self._PRIME_1, self._PRIME_2, self._MASK
+        rotate, unrotate = self._ROTATE, sys.hash_info.width - self._ROTATE
+        for item in items:
+            acc = (acc + (hash(item) & mask) * prime_2) & mask
+            acc = ((acc << rotate) | (acc >> unrotate)) & mask
+            acc = (acc * prime_1) & mask
+            length += 1
+        self._acc, self._length = acc, length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def digest(self) -> int:
+        """Returns the hash of the tuple of every item fed so far.
+
+        :return int: The same value as hash(tuple(items)).
+        """
+
+        mask = self._MASK
+        acc = (self._acc + (self._length ^ (self._PRIME_5 ^ 3527539))) & mask
+        if acc == mask:
+            return 1546275796
+        # Back to a signed Py_hash_t.
+        return acc - (mask + 1) if acc >> (sys.hash_info.width - 1) else acc
+
+def hash_stream(source: BinaryIO, n: int, block_size: int = 1 << 20) -> int:
+    """Hashes the tuple of the integers in a binary stream, block by block.
+
+    :param BinaryIO source: The stream to read.
+    :param int n: The expected amount of integers.
+    :param int block_size: The read size in bytes.
+    :return int: The same value as hash(tuple(integers)).
+
+    Raises:
+        ValueError: If n is < 1 or the amount of integers is not n.
+        TypeError: If a value is not an integer.
     """
 
     if n < 1:
         raise ValueError("Expected a positive non-zero integer.")
-    if n != len(user_input):
-        raise ValueError("Expected a positive non-zero integer.")
-    for number in user_input:
-        try:
-            number = int(number)
-        except Exception as e:
-            raise TypeError("Expected a positive non-zero integer.")
+    hasher = TupleHasher(read_integers(source, block_size))
+    if len(hasher) != n:
+        raise ValueError(f"Expected {n} integers, got {len(hasher)}.")
+    return hasher.digest()
 
 def main():
-    """Main block. Handles input, builds the tuple, computes the hash
-    and prints the result."""
+    """Main block. Handles input, hashes the integers as a tuple while they
+    are read and prints the result."""
 
-    input_count = input()
+    input_count = sys.stdin.buffer.readline()
     try:
         input_count = int(input_count)
     except Exception as e:
         raise TypeError("Expected a positive non-zero integer.")
-    user_input = raw_input().strip().split()
-    validate(input_count, user_input)
-
-    input_tuple = tuple(int(num) for num in user_input)
-    print(hash(input_tuple))
+    print(hash_stream(sys.stdin.buffer, input_count))
 
 if __name__ == "__main__":
     main()
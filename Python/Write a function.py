@@ -3,6 +3,11 @@
     https://www.hackerrank.com/challenges/write-a-function/problem
     """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def is_leap(year):
     if year % 400 == 0:
         return True
@@ -12,5 +17,67 @@ def is_leap(year):
         return True
     return False
 
-year = int(input())
-print(is_leap(year))
\ No newline at end of file
+def is_leap_array(years) -> "numpy.ndarray":
+    """Classifies a whole array of years at once, requires NumPy.
+
+    :param years: The years, any integer array-like.
+    :return numpy.ndarray: A boolean mask, True where is_leap is.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+
+    Examples:
+        >>> is_leap_array([1900, 2000, 2024, 2025]).tolist()  # doctest: +SKIP
+        [False, True, True, False]
+
+        The example is skipped because NumPy is optional. The cross-check
+        against is_leap in __test__ only runs, and is only counted, when
+        NumPy is installed.
+    """
+
+    if np is None:
+        raise ImportError("is_leap_array requires NumPy.")
+    years = np.asarray(years)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+def _leaps_before(year: int) -> int:
+    """Returns the leap years in [0, year), negated for negative years."""
+
+    # -(-year // k) counts the multiples of k in [0, year).
+    return -(-year // 4) + (-year // 100) - (-year // 400)
+
+def count_leap_years(start: int, stop: int) -> int:
+    """Counts the leap years in range(start, stop) in O(1).
+
+    Inclusion-exclusion: the multiples of 4, minus those of 100, plus those of 400.
+
+    :param int start: The first year.
+    :param int stop: The year after the last.
+    :return int: The number of leap years.
+
+    Examples:
+        >>> count_leap_years(1900, 2025)
+        31
+        >>> all(count_leap_years(a, b) == sum(map(is_leap, range(a, b)))
+        ...     for a in range(-801, 801, 37) for b in range(-801, 801, 41))
+        True
+    """
+
+    if stop <= start:
+        return 0
+    return _leaps_before(stop) - _leaps_before(start)
+
+# Doctests that need NumPy, collected by doctest only when it is installed.
+__test__ = {} if np is None else {
+    'is_leap_array matches is_leap': """
+        >>> years = range(-800, 2401)
+        >>> is_leap_array(years).tolist() == [is_leap(year) for year in years]
+        True
+        >>> is_leap_array([1900, 2000, 2024, 2025]).tolist()
+        [False, True, True, False]
+        """,
+}
+
+if __name__ == '__main__':
+    year = int(input())
+    print(is_leap(year))
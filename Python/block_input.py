@@ -0,0 +1,58 @@
+"""Block Input
+
+    Shared bulk input helper for the scripts that read long inputs.
+
+    Reading a large input line by line with input() spends most of the time
+    in per call overhead. This module reads a binary stream in large blocks
+    and splits each block at once, carrying the possibly incomplete last
+    token over to the next block.
+
+    Functions:
+        read_tokens: Yields the tokens of a binary stream, reading it in blocks.
+    """
+
+from collections.abc import Iterator
+from typing import BinaryIO
+
+__all__ = [
+    'read_tokens'
+]
+
+def read_tokens(
+    source: BinaryIO,
+    block_size: int = 1 << 20,
+    separator: bytes | None = None,
+    /) -> Iterator[bytes]:
+    """Yields the tokens of a binary stream like source.read().split(separator).
+
+    Only one block is held in memory at a time. Without a separator the
+    tokens are split on runs of whitespace, otherwise on every separator,
+    so for example b"\\n" yields the lines, empty ones included.
+
+    Args:
+        source (BinaryIO): The stream to read.
+        block_size (int, optional): The read size in bytes. Defaults to 1 MiB.
+        separator (bytes, optional): Where to split. Defaults to any whitespace.
+
+    Returns:
+        Iterator[bytes]: The tokens, in order.
+
+    Examples:
+        >>> from io import BytesIO
+        >>> list(read_tokens(BytesIO(b"12 345\\n6 "), 4))
+        [b'12', b'345', b'6']
+        >>> list(read_tokens(BytesIO(b"a b\\n\\nc"), 2, b"\\n"))
+        [b'a b', b'', b'c']
+    """
+
+    rest = b""
+    while block := source.read(block_size):
+        tokens = (rest + block).split(separator)
+        # The last token may continue in the next block.
+        if separator is not None or tokens and not block[-1:].isspace():
+            rest = tokens.pop()
+        else:
+            rest = b""
+        yield from tokens
+    if rest:
+        yield rest
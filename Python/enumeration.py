@@ -0,0 +1,493 @@
+"""Enumeration
+
+    Shared enumeration engine for the itertools scripts.
+
+    This module produces the same output as printing every tuple of
+    itertools.permutations, itertools.combinations or
+    itertools.combinations_with_replacement joined into a string, one per line.
+    The lexicographic output space is split into contiguous rank ranges
+    (shards) by fixing the first elements of each tuple; every shard is
+    rendered in a worker process with itertools over the remaining pool and
+    the rendered blocks are written in order.
+
+    For inputs with repeated items, the multiset functions yield every
+    distinct arrangement exactly once instead, without deduplicating the
+    itertools output.
+
+    Functions:
+        count_bytes: Computes the output size for a given kind and size.
+        count_lines: Counts the lines enumerated for a given kind and size.
+        count_multiset_bytes: Computes the distinct output size of a multiset.
+        count_multiset_combinations: Counts the distinct combinations of a multiset.
+        count_multiset_permutations: Counts the distinct permutations of a multiset.
+        multiset_combinations: Yields the distinct combinations of a multiset.
+        multiset_permutations: Yields the distinct permutations of a multiset.
+        shard: Splits the output space into rank ranges of similar size.
+        render_shard: Renders the lines of one shard.
+        write_enumeration: Writes every line, sharding across processes.
+        write_estimate: Writes the line counts and output sizes instead of the lines.
+    """
+
+import logging
+import os
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, combinations_with_replacement, permutations
+from math import comb, perm
+from typing import BinaryIO, TextIO
+
+logger = logging.getLogger(__name__)
+
+if not logger.handlers:
+    logger.addHandler(logging.NullHandler())
+
+__all__ = [
+    'KINDS',
+    'count_bytes',
+    'count_lines',
+    'count_multiset_bytes',
+    'count_multiset_combinations',
+    'count_multiset_permutations',
+    'multiset_combinations',
+    'multiset_permutations',
+    'render_shard',
+    'shard',
+    'write_enumeration',
+    'write_estimate'
+]
+
+KINDS = {
+    'permutations': permutations,
+    'combinations': combinations,
+    'combinations_with_replacement': combinations_with_replacement,
+}
+
+# Below this many lines the output is rendered in the calling process.
+SEQUENTIAL_LIMIT: int = 1 << 16
+
+def _check_kind(kind: str, /) -> None:
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {', '.join(KINDS)}, got {kind!r}.")
+
+def count_lines(kind: str, n: int, size: int, /) -> int:
+    """Counts the tuples of the given size enumerated over n items.
+
+    Args:
+        kind (str): One of the KINDS keys.
+        n (int): The amount of items.
+        size (int): The tuple size.
+
+    Returns:
+        int: The amount of lines.
+    """
+
+    _check_kind(kind)
+    if kind == 'permutations':
+        return perm(n, size)
+    if kind == 'combinations':
+        return comb(n, size)
+    if n == 0:
+        return int(size == 0)
+    return comb(n + size - 1, size)
+
+def count_bytes(kind: str, items: Sequence[str], size: int, /) -> int:
+    """Computes the size in bytes of the UTF-8 output for the given kind and size.
+
+    Every kind is symmetric in its items, so each item fills lines * size / n
+    of the slots and the size follows from the line count alone.
+
+    Args:
+        kind (str): One of the KINDS keys.
+        items (Sequence[str]): The items to enumerate.
+        size (int): The tuple size.
+
+    Returns:
+        int: The amount of bytes, new lines included.
+    """
+
+    lines = count_lines(kind, len(items), size)
+    if not items:
+        return lines
+    item_bytes = sum(len(item.encode('utf-8')) for item in items)
+    return lines + lines * size * item_bytes // len(items)
+
+def _pool(kind: str, n: int, prefix: Sequence[int], /) -> list[int]:
+    """Returns the positions that may follow the given prefix, in order."""
+
+    if not prefix:
+        return list(range(n))
+    if kind == 'permutations':
+        used = set(prefix)
+        return [i for i in range(n) if i not in used]
+    if kind == 'combinations':
+        return list(range(prefix[-1] + 1, n))
+    return list(range(prefix[-1], n))
+
+def _prefix_lines(kind: str, n: int, size: int, prefix: Sequence[int], /) -> int:
+    """Counts the lines starting with the given prefix."""
+
+    return count_lines(kind, len(_pool(kind, n, prefix)), size - len(prefix))
+
+def shard(kind: str, n: int, size: int, shards: int, /) -> list[tuple[int, int, list[tuple[int, ...]]]]:
+    """Splits the output space into contiguous rank ranges of similar size.
+
+    The tuples are grouped by their first depth positions, with depth the
+    smallest one giving at least 8 prefixes per shard, and consecutive
+    prefixes are packed greedily into shards.
+
+    Args:
+        kind (str): One of the KINDS keys.
+        n (int): The amount of items.
+        size (int): The tuple size.
+        shards (int): The wanted amount of shards.
+
+    Returns:
+        list[tuple[int, int, list[tuple[int, ...]]]]: The (start, stop, prefixes)
+            of each shard, where [start, stop) is its rank range.
+    """
+
+    _check_kind(kind)
+    depth = 0
+    prefixes: list[tuple[int, ...]] = [()]
+    while depth < size and len(prefixes) < 8 * shards:
+        depth += 1
+        prefixes = list(KINDS[kind](range(n), depth))
+
+    counts = [_prefix_lines(kind, n, size, prefix) for prefix in prefixes]
+    total = sum(counts)
+    target = max(1, -(total // -shards))
+
+    result: list[tuple[int, int, list[tuple[int, ...]]]] = []
+    start = stop = 0
+    group: list[tuple[int, ...]] = []
+    for prefix, lines in zip(prefixes, counts):
+        if not lines:
+            continue
+        group.append(prefix)
+        stop += lines
+        if stop - start >= target:
+            result.append((start, stop, group))
+            start, group = stop, []
+    if group:
+        result.append((start, stop, group))
+    return result
+
+def render_shard(kind: str, items: Sequence[str], size: int, prefixes: Sequence[Sequence[int]], /) -> bytes:
+    """Renders the lines of the tuples starting with the given prefixes.
+
+    Args:
+        kind (str): One of the KINDS keys.
+        items (Sequence[str]): The items to enumerate, already sorted.
+        size (int): The tuple size.
+        prefixes (Sequence[Sequence[int]]): Consecutive prefixes of item positions.
+
+    Returns:
+        bytes: The lines, each one terminated by a new line.
+    """
+
+    _check_kind(kind)
+    generate = KINDS[kind]
+    n = len(items)
+    chunks: list[str] = []
+    for prefix in prefixes:
+        head = ''.join(items[i] for i in prefix)
+        pool = [items[i] for i in _pool(kind, n, prefix)]
+        tails = map(''.join, generate(pool, size - len(prefix)))
+        if head:
+            tails = (head + tail for tail in tails)
+        chunks.extend(tail + '\n' for tail in tails)
+    return ''.join(chunks).encode('utf-8')
+
+def _render_shards(kind: str, items: Sequence[str], size: int, workers: int, /) -> Iterator[bytes]:
+    n = len(items)
+    total = count_lines(kind, n, size)
+    if workers <= 1 or total < SEQUENTIAL_LIMIT:
+        logger.debug("Rendering %s lines in process.", total)
+        # Shard anyway so that a single block never holds the whole output.
+        for _, _, prefixes in shard(kind, n, size, max(1, total // SEQUENTIAL_LIMIT)):
+            yield render_shard(kind, items, size, prefixes)
+        return
+
+    shards = shard(kind, n, size, max(workers, total // SEQUENTIAL_LIMIT))
+    logger.debug("Rendering %s lines in %s shards on %s workers.", total, len(shards), workers)
+    with ProcessPoolExecutor(workers) as executor:
+        # Only keep a bounded window of shards in flight, in order.
+        window = 2 * workers
+        pending = []
+        for _, _, prefixes in shards:
+            pending.append(executor.submit(render_shard, kind, items, size, prefixes))
+            if len(pending) >= window:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+def write_enumeration(
+    kind: str,
+    items: Sequence[str],
+    size: int,
+    stream: BinaryIO | None = None,
+    workers: int | None = None,
+    /) -> None:
+    """Writes the joined tuples of the given kind, one per line.
+
+    The output is byte-identical to printing ''.join(t) for every t in
+    KINDS[kind](items, size).
+
+    Args:
+        kind (str): One of the KINDS keys.
+        items (Sequence[str]): The items to enumerate, already sorted.
+        size (int): The tuple size.
+        stream (BinaryIO, optional): Where to write. Defaults to sys.stdout.buffer.
+        workers (int, optional): Worker processes. Defaults to os.cpu_count().
+
+    Raises:
+        ValueError: If kind is unknown.
+    """
+
+    _check_kind(kind)
+    if stream is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    for block in _render_shards(kind, items, size, workers):
+        stream.write(block)
+    stream.flush()
+
+def write_estimate(
+    kind: str,
+    items: Sequence[str],
+    sizes: Iterable[int],
+    with_bytes: bool = True,
+    stream: TextIO | None = None,
+    distinct: bool = False,
+    /) -> None:
+    """Writes the amount of lines, and optionally bytes, each size would produce.
+
+    One row is written per size, followed by a total row, without
+    enumerating anything.
+
+    Args:
+        kind (str): One of the KINDS keys.
+        items (Sequence[str]): The items to enumerate.
+        sizes (Iterable[int]): The tuple sizes the script would produce.
+        with_bytes (bool, optional): Whether to include the output size. Defaults to True.
+        stream (TextIO, optional): Where to write. Defaults to sys.stdout.
+        distinct (bool, optional): Count the distinct output of the multiset
+            functions instead. Defaults to False.
+    """
+
+    if stream is None:
+        stream = sys.stdout
+
+    total_lines = total_bytes = 0
+    rows: list[tuple[str, int, int]] = []
+    for size in sizes:
+        if not distinct:
+            lines = count_lines(kind, len(items), size)
+            output_bytes = count_bytes(kind, items, size)
+        elif kind == 'permutations':
+            lines = count_multiset_permutations(items, size)
+            output_bytes = count_multiset_bytes(kind, items, size)
+        else:
+            lines = count_multiset_combinations(items, size)
+            output_bytes = count_multiset_bytes(kind, items, size)
+        total_lines += lines
+        total_bytes += output_bytes
+        rows.append((str(size), lines, output_bytes))
+    rows.append(('total', total_lines, total_bytes))
+
+    for size, lines, output_bytes in rows:
+        if with_bytes:
+            stream.write(f"{size}\t{lines} lines\t{output_bytes} bytes\n")
+        else:
+            stream.write(f"{size}\t{lines} lines\n")
+
+def _multiset(items: Iterable[str], /) -> tuple[list[str], list[int]]:
+    """Returns the distinct items in order and how many times each one appears."""
+
+    counter = Counter(items)
+    values = sorted(counter)
+    return values, [counter[value] for value in values]
+
+def _next_permutation(letters: list[str], /) -> bool:
+    """Rearranges letters into the next lexicographic permutation in place.
+
+    This is Knuth's Algorithm L, which skips equal arrangements on its own.
+
+    Returns:
+        bool: False if letters was the last permutation.
+    """
+
+    j = len(letters) - 2
+    while j >= 0 and letters[j] >= letters[j + 1]:
+        j -= 1
+    if j < 0:
+        return False
+    k = len(letters) - 1
+    while letters[j] >= letters[k]:
+        k -= 1
+    letters[j], letters[k] = letters[k], letters[j]
+    letters[j + 1:] = letters[:j:-1]
+    return True
+
+def _walk_multiset(items: Iterable[str], size: int, ordered: bool, /) -> Iterator[str]:
+    """Depth-first walk over the item counts, in lexicographic order.
+
+    Only the counts and the current path are kept, so memory is O(n).
+    """
+
+    values, counts = _multiset(items)
+    path: list[int] = []
+    choice = 0
+    while True:
+        if len(path) == size:
+            yield ''.join(values[v] for v in path)
+        else:
+            while choice < len(values) and not counts[choice]:
+                choice += 1
+            if choice < len(values):
+                counts[choice] -= 1
+                path.append(choice)
+                # Permutations restart from the smallest item, combinations never go back.
+                choice = 0 if ordered else choice
+                continue
+        if not path:
+            return
+        last = path.pop()
+        counts[last] += 1
+        choice = last + 1
+
+def multiset_permutations(items: Iterable[str], size: int | None = None, /) -> Iterator[str]:
+    """Yields the distinct size-permutations of items in lexicographic order.
+
+    This is the output of itertools.permutations(sorted(items), size) with
+    the duplicates removed, for example 'AAB' gives AAB, ABA and BAA.
+
+    Args:
+        items (Iterable[str]): The items, repetitions allowed.
+        size (int, optional): The permutation size. Defaults to all the items.
+
+    Returns:
+        Iterator[str]: The joined permutations.
+    """
+
+    letters = sorted(items)
+    if size is None or size == len(letters):
+        yield ''.join(letters)
+        while _next_permutation(letters):
+            yield ''.join(letters)
+    elif 0 <= size < len(letters):
+        yield from _walk_multiset(letters, size, True)
+
+def multiset_combinations(items: Iterable[str], size: int, /) -> Iterator[str]:
+    """Yields the distinct size-combinations of items in lexicographic order.
+
+    This is the output of itertools.combinations(sorted(items), size) with
+    the duplicates removed, for example 'AAB' and size 2 give AA and AB.
+
+    Args:
+        items (Iterable[str]): The items, repetitions allowed.
+        size (int): The combination size.
+
+    Returns:
+        Iterator[str]: The joined combinations.
+    """
+
+    letters = sorted(items)
+    if 0 <= size <= len(letters):
+        yield from _walk_multiset(letters, size, False)
+
+def count_multiset_permutations(items: Iterable[str], size: int | None = None, /) -> int:
+    """Counts the distinct size-permutations of items.
+
+    For the full size this is the multinomial n! / (c1! c2! ...). Shorter
+    sizes add one item kind at a time: placing k copies among j + k slots
+    multiplies by comb(j + k, k).
+
+    Args:
+        items (Iterable[str]): The items, repetitions allowed.
+        size (int, optional): The permutation size. Defaults to all the items.
+
+    Returns:
+        int: The amount of distinct permutations.
+    """
+
+    _, counts = _multiset(items)
+    n = sum(counts)
+    if size is None:
+        size = n
+    if not 0 <= size <= n:
+        return 0
+    # ways[j] counts the arrangements of length j of the kinds seen so far.
+    ways = [1] + [0] * size
+    for count in counts:
+        for j in range(size, 0, -1):
+            ways[j] = sum(ways[j - k] * comb(j, k) for k in range(min(count, j) + 1))
+    return ways[size]
+
+def count_multiset_combinations(items: Iterable[str], size: int, /) -> int:
+    """Counts the distinct size-combinations of items.
+
+    This is the coefficient of x^size in the product of (1 + x + ... + x^c)
+    over the count c of each item kind.
+
+    Args:
+        items (Iterable[str]): The items, repetitions allowed.
+        size (int): The combination size.
+
+    Returns:
+        int: The amount of distinct combinations.
+    """
+
+    _, counts = _multiset(items)
+    if not 0 <= size <= sum(counts):
+        return 0
+    ways = [1] + [0] * size
+    for count in counts:
+        for j in range(size, 0, -1):
+            ways[j] = sum(ways[j - k] for k in range(min(count, j) + 1))
+    return ways[size]
+
+def count_multiset_bytes(kind: str, items: Iterable[str], size: int, /) -> int:
+    """Computes the size in bytes of the UTF-8 distinct output of a multiset.
+
+    This is the output of multiset_permutations or multiset_combinations.
+    Unlike count_bytes the items are not symmetric, so next to the count of
+    arrangements of each length, the total bytes of those arrangements are
+    carried through the same recurrence as count_multiset_permutations.
+
+    Args:
+        kind (str): 'permutations' or 'combinations'.
+        items (Iterable[str]): The items, repetitions allowed.
+        size (int): The tuple size.
+
+    Raises:
+        ValueError: If the kind has no distinct output.
+
+    Returns:
+        int: The amount of bytes, new lines included.
+    """
+
+    if kind not in ('permutations', 'combinations'):
+        raise ValueError(f"kind must be permutations or combinations, got {kind!r}.")
+    values, counts = _multiset(items)
+    if not 0 <= size <= sum(counts):
+        return 0
+    ordered = kind == 'permutations'
+    # ways[j] counts the arrangements of length j of the kinds seen so far, weights[j] their bytes.
+    ways = [1] + [0] * size
+    weights = [0] * (size + 1)
+    for value, count in zip(values, counts):
+        width = len(value.encode('utf-8'))
+        for j in range(size, 0, -1):
+            total = weight = 0
+            for k in range(min(count, j) + 1):
+                places = comb(j, k) if ordered else 1
+                total += ways[j - k] * places
+                weight += (weights[j - k] + k * width * ways[j - k]) * places
+            ways[j], weights[j] = total, weight
+    return ways[size] + weights[size]
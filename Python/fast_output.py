@@ -0,0 +1,115 @@
+"""Fast Output
+
+    Shared bulk output helpers for the scripts that print long integer sequences.
+
+    Printing one number per print call, or unpacking a huge range into a
+    single print call, spends most of the time in per call overhead or in
+    building the argument tuple. This module formats the numbers in blocks
+    and writes each block with a single call to sys.stdout.buffer.write.
+
+    Functions:
+        write_integers: Writes integers like print(*numbers, sep=sep, end=end).
+        squares: Lazily yields the squares of range(n).
+        benchmark: Compares the throughput against plain print calls.
+    """
+
+import os
+import sys
+import timeit
+from collections.abc import Iterable
+from itertools import islice
+from operator import mul
+from typing import BinaryIO
+
+__all__ = [
+    'benchmark',
+    'squares',
+    'write_integers'
+]
+
+def write_integers(
+    numbers: Iterable[int],
+    sep: str = ' ',
+    end: str = '\n',
+    stream: BinaryIO | None = None,
+    block_items: int = 1 << 16,
+    /) -> int:
+    """Writes integers like print(*numbers, sep=sep, end=end), in large blocks.
+
+    Args:
+        numbers (Iterable[int]): The integers to write. Consumed lazily.
+        sep (str, optional): The separator between numbers. Defaults to ' '.
+        end (str, optional): Written after the last number. Defaults to a new line.
+        stream (BinaryIO, optional): Where to write. Defaults to sys.stdout.buffer.
+        block_items (int, optional): Numbers formatted per write. Defaults to 65536.
+
+    Returns:
+        int: The amount of bytes written.
+    """
+
+    if stream is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+
+    numbers = iter(numbers)
+    separator = sep.encode()
+    written = 0
+    first = True
+    while chunk := list(islice(numbers, block_items)):
+        if not first:
+            written += stream.write(separator)
+        written += stream.write(separator.join(map(b'%d'.__mod__, chunk)))
+        first = False
+    written += stream.write(end.encode())
+    stream.flush()
+    return written
+
+def squares(n: int, /) -> Iterable[int]:
+    """Lazily yields i**2 for 0 <= i < n, without a Python level loop."""
+
+    numbers = range(n)
+    return map(mul, numbers, numbers)
+
+def benchmark(n: int = 10 ** 7, /) -> dict[str, float]:
+    """Times the Loops and Print Function outputs against the previous versions.
+
+    Everything is written to os.devnull.
+
+    Args:
+        n (int, optional): The input of both scripts. Defaults to 10**7.
+
+    Returns:
+        dict[str, float]: Millions of numbers written per second by each approach.
+    """
+
+    stdout = sys.stdout
+    results: dict[str, float] = {}
+    with open(os.devnull, 'w') as devnull:
+
+        def print_loop() -> None:
+            for i in range(n):
+                print(i**2)
+
+        def print_unpacked() -> None:
+            print(*range(1, n + 1), sep='')
+
+        sys.stdout = devnull
+        try:
+            timings = {
+                'Loops print': timeit.timeit(print_loop, number=1),
+                'Loops write_integers': timeit.timeit(
+                    lambda: write_integers(squares(n), '\n', '\n', devnull.buffer), number=1),
+                'Print Function print': timeit.timeit(print_unpacked, number=1),
+                'Print Function write_integers': timeit.timeit(
+                    lambda: write_integers(range(1, n + 1), '', '\n', devnull.buffer), number=1),
+            }
+        finally:
+            sys.stdout = stdout
+    for name, seconds in timings.items():
+        results[name] = n / seconds / 1e6
+    return results
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    for name, throughput in benchmark(size).items():
+        print(f"{name:>30}: {throughput:8.2f} M numbers/s")
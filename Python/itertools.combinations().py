@@ -3,7 +3,9 @@
     https://www.hackerrank.com/challenges/itertools-combinations/problem
     """
 
-from itertools import combinations
+import sys
+
+from enumeration import write_enumeration, write_estimate
 
 def validate(user_input: list[str]) -> None:
     """Validates the input according to the constrains.
@@ -25,16 +27,21 @@ def validate(user_input: list[str]) -> None:
     if len(user_input[0]) < n:
         raise ValueError("The string's length must be greater or equal to the combination's length.")
 
-def main() -> None:
-    """Main function. Handles input, validation and generates the combinations."""
+def main(count: bool = False, estimate: bool = False) -> None:
+    """Main function. Handles input, validation and generates the combinations.
+
+    :param bool count: Only print how many lines each combination length produces.
+    :param bool estimate: Like count, also printing the output size in bytes.
+    """
 
     user_input: list[str] = input().strip().split()
     validate(user_input)
     input_string = sorted(user_input[0].strip())
+    if count or estimate:
+        write_estimate('combinations', input_string, range(1, int(user_input[1]) + 1), estimate)
+        return
     for i in range(1, int(user_input[1]) + 1):
-        combos = combinations(input_string, i)
-        for combo in combos:
-            print(''.join(combo))
+        write_enumeration('combinations', input_string, i)
 
 if __name__ == "__main__":
-    main()
+    main('--count' in sys.argv[1:], '--estimate' in sys.argv[1:])
@@ -3,7 +3,9 @@
     https://www.hackerrank.com/challenges/itertools-combinations-with-replacement/problem
     """
 
-from itertools import combinations_with_replacement
+import sys
+
+from enumeration import write_enumeration, write_estimate
 
 def validate(user_input: list[str]) -> None:
     """Validates the input according to the constraints.
@@ -25,17 +27,22 @@ def validate(user_input: list[str]) -> None:
     if len(user_input[0]) < n:
         raise ValueError("The input string must be longer or equal to the combination length.")
 
-def main() -> None:
-    """Main funcion. Handles input, validates it and generates the combinations."""
+def main(count: bool = False, estimate: bool = False) -> None:
+    """Main funcion. Handles input, validates it and generates the combinations.
+
+    :param bool count: Only print how many lines would be produced.
+    :param bool estimate: Like count, also printing the output size in bytes.
+    """
 
     user_input = input().strip().split()
     validate(user_input)
 
     input_string = sorted(user_input[0])
     combo_len = int(user_input[1])
-    combos = combinations_with_replacement(input_string, combo_len)
-    for combo in combos:
-        print(''.join(combo))
+    if count or estimate:
+        write_estimate('combinations_with_replacement', input_string, [combo_len], estimate)
+    else:
+        write_enumeration('combinations_with_replacement', input_string, combo_len)
 
 if __name__ == '__main__':
-    main()
+    main('--count' in sys.argv[1:], '--estimate' in sys.argv[1:])
@@ -3,7 +3,12 @@
     https://www.hackerrank.com/challenges/itertools-permutations/problem
     """
 
-from itertools import permutations
+import sys
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from math import perm
+
+from enumeration import multiset_permutations, write_enumeration, write_estimate
 
 def validate(inputs: list) -> None:
     """Validates the inputs according to the problem's constraints.
@@ -22,16 +27,144 @@ def validate(inputs: list) -> None:
     except Exception as e:
         raise TypeError(f"Expected an integer as permutation size argument: {e}") from e
 
-def main() -> None:
-    """Main function. Handles input and creates the permutations."""
+def unrank(n: int, size: int, index: int) -> list[int]:
+    """Returns the positions of the index-th size-permutation of n positions.
+
+    The index is read in the factorial number system: each digit picks one of
+    the positions still unused, in itertools.permutations order.
+
+    :param int n: The amount of positions to permute.
+    :param int size: The permutation size.
+    :param int index: The lexicographic rank, 0 <= index < perm(n, size).
+    :return list[int]: The permuted positions.
+
+    Raises:
+        IndexError: If the index is out of range.
+    """
+
+    if not 0 <= index < perm(n, size):
+        raise IndexError(f"Permutation index {index} out of range.")
+    remaining = list(range(n))
+    positions: list[int] = []
+    for depth in range(size):
+        digit, index = divmod(index, perm(n - depth - 1, size - depth - 1))
+        positions.append(remaining.pop(digit))
+    return positions
+
+def rank(n: int, positions: Sequence[int]) -> int:
+    """Returns the lexicographic rank of a size-permutation of n positions.
+
+    This is the inverse of unrank.
+
+    :param int n: The amount of positions to permute.
+    :param Sequence[int] positions: The permuted positions.
+    :return int: The lexicographic rank.
+    """
+
+    size = len(positions)
+    used = [False] * n
+    index = 0
+    for depth, position in enumerate(positions):
+        digit = position - sum(used[:position])
+        index += digit * perm(n - depth - 1, size - depth - 1)
+        used[position] = True
+    return index
+
+def _successor(n: int, positions: list[int], used: list[int]) -> bool:
+    """Advances positions to the next size-permutation in place.
+
+    used holds the same positions in ascending order, so the unused ones are
+    the gaps between its items. A step only walks the gaps next to the
+    positions it changes, instead of scanning all n positions.
+
+    :return bool: False if positions was the last permutation.
+    """
+
+    size = len(positions)
+    for depth in range(size - 1, -1, -1):
+        current = positions[depth]
+        index = bisect_left(used, current)
+        del used[index]
+        # Smallest unused position greater than the current one.
+        candidate = current + 1
+        end = len(used)
+        while index < end and used[index] == candidate:
+            candidate += 1
+            index += 1
+        if candidate >= n:
+            continue
+        positions[depth] = candidate
+        used.insert(index, candidate)
+        # Refill the tail with the smallest unused positions, in order.
+        candidate = index = 0
+        end += 1
+        for tail in range(depth + 1, size):
+            while index < end and used[index] == candidate:
+                candidate += 1
+                index += 1
+            positions[tail] = candidate
+            used.insert(index, candidate)
+            candidate += 1
+            index += 1
+            end += 1
+        return True
+    return False
+
+def nth(string: str, size: int, index: int) -> str:
+    """Returns the index-th line the script would print for the given input.
+
+    :param str string: The input string.
+    :param int size: The permutation size.
+    :param int index: The line number, negative indices count from the end.
+    :return str: The permutation.
+    """
+
+    letters = sorted(string)
+    if index < 0:
+        index += perm(len(letters), size)
+    return ''.join(letters[i] for i in unrank(len(letters), size, index))
+
+def page(string: str, size: int, start: int, count: int) -> Iterator[str]:
+    """Yields count lines the script would print, from line start onwards.
+
+    Only the first permutation is unranked, the following ones are reached by
+    successor steps, so the prefix before start is never enumerated.
+
+    :param str string: The input string.
+    :param int size: The permutation size.
+    :param int start: The first line number.
+    :param int count: The maximum amount of lines to yield.
+    :return Iterator[str]: The permutations.
+    """
+
+    letters = sorted(string)
+    n = len(letters)
+    if count <= 0 or start >= perm(n, size):
+        return
+    positions = unrank(n, size, start)
+    used = sorted(positions)
+    for _ in range(count):
+        yield ''.join(letters[i] for i in positions)
+        if not _successor(n, positions, used):
+            return
+
+def main(distinct: bool = False, count: bool = False, estimate: bool = False) -> None:
+    """Main function. Handles input and creates the permutations.
+
+    :param bool distinct: Whether to print repeated arrangements only once.
+    :param bool count: Only print how many lines would be produced.
+    :param bool estimate: Like count, also printing the output size in bytes.
+    """
 
     user_inputs = input().strip().split()
     validate(user_inputs)
 
-    perms = permutations(sorted(user_inputs[0]), int(user_inputs[1]))
-
-    for perm in perms:
-        print("".join(perm))
+    if count or estimate:
+        write_estimate('permutations', sorted(user_inputs[0]), [int(user_inputs[1])], estimate, None, distinct)
+    elif distinct:
+        sys.stdout.writelines(f"{line}\n" for line in multiset_permutations(user_inputs[0], int(user_inputs[1])))
+    else:
+        write_enumeration('permutations', sorted(user_inputs[0]), int(user_inputs[1]))
 
 if __name__ == "__main__":
-    main()
+    main('--distinct' in sys.argv[1:], '--count' in sys.argv[1:], '--estimate' in sys.argv[1:])